@@ -77,6 +77,7 @@ class Element(Element_P):
     is_overflown_y: bool = False
     # overflow_x: Overflow
     overflow_y: Overflow
+    aligner: text_align.TextAlign
 
     @property
     def max_scrolly(self):
@@ -280,6 +281,7 @@ class Element(Element_P):
         )
         # self.overflow_x = overflow[style["overflow-x"]]
         self.overflow_y = overflow[style["overflow-y"]]
+        self.aligner = text_align.aligners[style["text-align"]]
         # style sharing and child computing
         self.cstyle = g["cstyles"].add(style)
         for child in self.children:
@@ -643,6 +645,7 @@ class StyleElement(MetaElement):
 
     def reload_src(self):
         g["css_sheets"].remove(self.src_sheet)
+        g["css_sheet"] = None
         util.create_task(parse_file(self.src), True, self.parse_callback)
 
 
@@ -1219,6 +1222,20 @@ class TextElement(Leaf_P):
     def __init__(self, text: str):
         self.text = text
 
+    _split_text: str | None = None
+    _words: list[str]
+
+    @property
+    def words(self) -> list[str]:
+        """
+        The whitespace separated words of the text.
+        They are cached as long as the text stays the same.
+        """
+        if self._split_text is not self.text:
+            self._words = self.text.split()
+            self._split_text = self.text
+        return self._words
+
     # def collide(self, pos: Coordinate):
     #     assert self.display == "block"
     #     if self.box.border_box.collidepoint(pos):
@@ -1299,3 +1316,4 @@ elem_type_map: dict[str, type[Element]] = {
 
 
 import positron.element.layout as layout
+import positron.element.layout.text_align as text_align
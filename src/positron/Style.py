@@ -5,6 +5,7 @@ from abc import abstractmethod
 import asyncio
 import math
 import re
+import sys
 from collections import defaultdict, deque
 from contextlib import suppress
 from dataclasses import dataclass
@@ -25,13 +26,14 @@ from .config import (abs_angle_units, abs_border_width, abs_font_size,
                     abs_time_units, cursors, g, rel_font_size,
                     rel_length_units)
 from .types import (V_T, Angle, Auto, AutoType, BugError, Color, CompStr,
-                       CSSDimension, Drawable, Float4Tuple, FontStyle, Length,
-                       LengthPerc, Number, Percentage, Resolution, Sentinel,
-                       Str4Tuple, StrSent, Time, frozendict)
+                       CSSDimension, Drawable, Float4Tuple, FontStyle,
+                       FrozenDCache, Length, LengthPerc, Number, Percentage,
+                       Resolution, Sentinel, Str4Tuple, StrSent, Time)
 from .style.itemgetters import *
 from .style.MediaQuery import *
-from .style.Parser import Parser, parse_important, set_curr_file
-from .utils import (consume_list, fetch_txt, find_index, group_by_bool,
+from .style.Parser import (Parser, intern_value, parse_important,
+                           set_curr_file)
+from .utils import (fetch_txt, find_index, group_by_bool,
                   in_bounds, log_error, make_default, noop, print_once,
                   tup_replace)
 from .utils.colors import hsl2rgb, hwb2rgb
@@ -541,12 +543,17 @@ def color(value: str, p_style):
         return Color(value)
 
 
+# the scaling factors of the font-size keywords are computed once upfront
+abs_font_size_factors = {k: 1.2**v for k, v in abs_font_size.items()}
+rel_font_size_factors = {k: 1.2**v for k, v in rel_font_size.items()}
+
+
 def font_size(value: str, p_style):
-    if value in abs_font_size:
-        return g["default_font_size"] * 1.2 ** abs_font_size[value]
+    if (factor := abs_font_size_factors.get(value)) is not None:
+        return g["default_font_size"] * factor
     p_size: float = p_style["font-size"]
-    if value in rel_font_size:
-        return p_size * 1.2 ** rel_font_size[value]
+    if (factor := rel_font_size_factors.get(value)) is not None:
+        return p_size * factor
     else:
         if (rv := length_percentage(value, p_style)) is None:
             return None
@@ -601,7 +608,9 @@ def _length(dimension: tuple[float, str], p_style):
     num, s = dimension
     if num == 0:
         return Length(0)
-    abs_length: dict[str, float] = abs_length_units
+    elif s == "px":  # by far the most common unit
+        return Length(num)
+    abs_length: Mapping[str, float] = abs_length_units
     w: int = g["W"]
     h: int = g["H"]
     rv: float
@@ -900,31 +909,36 @@ def parse_inline_style(s: str):
     return process(pre_parsed)
 
 
-parse_lock = asyncio.Lock()
-
-
 async def parse_file(source: str) -> SourceSheet:
     """
     Parses a file from the given source (any url).
     It sets the current_file globally which is just for debugging purposes.
     """
-    async with (
-        parse_lock
-    ):  # with this we ensure that only one css-sheet is ever parsed at the same time
-        with set_curr_file(source):
-            return parse_sheet(await fetch_txt(source))
+    text = await fetch_txt(source)
+    # tinycss' parser is stateless, so several sheets can be parsed in parallel
+    tiny_sheet = await asyncio.to_thread(Parser.parse_stylesheet, text)
+    # the rest runs synchronously, so the current_file can't get mixed up
+    with set_curr_file(source):
+        return handle_sheet(tiny_sheet)
 
 
 def parse_sheet(source: str) -> SourceSheet:
     """
     Parses a whole css sheet
     """
-    tiny_sheet: tinycss.css21.Stylesheet = Parser.parse_stylesheet(source)
+    return handle_sheet(Parser.parse_stylesheet(source))
+
+
+def handle_sheet(tiny_sheet: tinycss.css21.Stylesheet) -> SourceSheet:
     for error in tiny_sheet.errors:
         log_error(error)
     return handle_rules(tiny_sheet.rules)
 
 
+decl_cache = FrozenDCache()
+""" Identical declaration blocks of different rules share one frozendict """
+
+
 def handle_rules(rules: list):
     return SourceSheet(filter(None, (handle_rule(rule) for rule in rules)))
 
@@ -945,7 +959,7 @@ def handle_rule(
         try:
             return (
                 Selector.parse_selector(rule.selector.as_css()),
-                frozendict(
+                decl_cache.add(
                     process(
                         [
                             (
@@ -1000,6 +1014,15 @@ smart_shorthands = {
     "outline": {"outline-width", "outline-style", "outline-color"},
 }
 
+# One table for all known properties, so that a single lookup tells
+# whether a key is a longhand, a direction shorthand or a smart shorthand
+LONGHAND, DIR_SHORTHAND, SMART_SHORTHAND = 0, 1, 2
+prop_table: dict[str, tuple[int, Any]] = {
+    **{k: (LONGHAND, attr) for k, attr in style_attrs.items()},
+    **{k: (DIR_SHORTHAND, keys) for k, keys in dir_shorthands.items()},
+    **{k: (SMART_SHORTHAND, keys) for k, keys in smart_shorthands.items()},
+}
+
 # we cache resolvable initial values
 initial_value_cache: dict[str, str | CompValue] = {
     # we could put stuff in here that we know about
@@ -1017,30 +1040,38 @@ def is_valid(key: str, value: str) -> None | str | CompValue:
     ...
 
 
-def is_valid(key: str, value: str) -> None | str | CompValue:
+def is_valid(
+    key: str,
+    value: str,
+    # bound as defaults so the lookups are local in this hot path
+    _get_prop=prop_table.get,
+    _initials=initial_value_cache,
+    _defaults=abs_default_style,
+) -> None | str | CompValue:
     """
     Checks whether the given CSS property is valid
     If this returns None the CSS property is invalid
     else this could already resolve the computed value
     or at least return a (maybe further resolved) input value (a str)
     """
-    global initial_value_cache, abs_default_style, style_attrs, dir_shorthands
     if value == "inherit":
         return value
-    elif (attr := style_attrs.get(key)) is not None:
+    kind, payload = _get_prop(key, (None, None))
+    if kind == LONGHAND:
+        attr: StyleAttr = payload
         if value == "initial":
-            if (new_value := initial_value_cache.get(key)) is None:
-                new_value = initial_value_cache[key] = is_valid(key, attr.initial)
+            if (new_value := _initials.get(key)) is None:
+                new_value = _initials[key] = is_valid(key, attr.initial)
             return new_value
         elif value == "unset":
-            return is_valid(key, abs_default_style[key])
+            return is_valid(key, _defaults[key])
         elif value == "revert":
             return "inherit" if attr.inherits else "revert"
         with suppress(KeyError):
             return attr.accept(value, p_style={})
         return value
-    elif (keys := dir_shorthands.get(key)) is not None:
-        return is_valid(keys[0], value)
+    elif kind == DIR_SHORTHAND:
+        return is_valid(payload[0], value)
     else:
         return CompStr(value)
 
@@ -1055,7 +1086,13 @@ def process_dir(value: list[str]):
 
 
 # IDEA: cache this
-def process_property(key: str, value: str) -> list[tuple[str, str]] | CompValue | str:
+def process_property(
+    key: str,
+    value: str,
+    _attrs=style_attrs,
+    _get_prop=prop_table.get,
+    _globals=frozenset(global_values),
+) -> list[tuple[str, str]] | CompValue | str:
     """
     Processes a single Property
     If this returns a single value it is final
@@ -1067,12 +1104,11 @@ def process_property(key: str, value: str) -> list[tuple[str, str]] | CompValue
     if is_custom(key):
         return CompStr(value)
     arr = split_value(value)
+    kind, payload = _get_prop(key, (None, None))
     if key == "all":
         assert len(arr) == 1
-        assert (
-            value in global_values
-        ), "'all' can only set global values eg. 'all: unset'"
-        return [(key, value) for key in style_attrs]
+        assert value in _globals, "'all' can only set global values eg. 'all: unset'"
+        return [(key, value) for key in _attrs]
     elif key == "border-radius" and "/" in value:
         x_y = re.split(r"\s*/\s*", value, 1)
         return list(
@@ -1090,13 +1126,14 @@ def process_property(key: str, value: str) -> list[tuple[str, str]] | CompValue
         split_len = len(split)
         assert split_len <= max_len, f"Too many values: {split_len}, max {max_len}"
         return list(zip(overflow_keys, split * (max_len // split_len)))
-    elif (keys := dir_shorthands.get(key)) is not None:
-        return list(zip(keys, process_dir(arr)))
-    elif (shorthand := smart_shorthands.get(key)) is not None:
+    elif kind == DIR_SHORTHAND:
+        return list(zip(payload, process_dir(arr)))
+    elif kind == SMART_SHORTHAND:
+        shorthand: set[str] = payload
         assert len(arr) <= len(
             shorthand
         ), f"Too many values: {len(arr)}, max {len(shorthand)}"
-        if len(arr) == 1 and (_global := arr[0]) in global_values:
+        if len(arr) == 1 and (_global := arr[0]) in _globals:
             return [(k, _global) for k in shorthand]
         _shorthand = shorthand.copy()
         result: list[tuple[str, str]] = []
@@ -1110,7 +1147,7 @@ def process_property(key: str, value: str) -> list[tuple[str, str]] | CompValue
             result.append((k, sub_value))
         return result
     else:
-        assert key in style_attrs, "Unknown Property"
+        assert kind == LONGHAND, "Unknown Property"
         assert (new_val := is_valid(key, value)) is not None, "Invalid Value"
         return new_val
 
@@ -1121,13 +1158,19 @@ def process_input(d: Iterable[tuple[str, str]]) -> dict[str, CompValue]:
     """
     d = list(d)
     done: dict[str, CompValue] = {}
-    for k, v in consume_list(d):
+    # expanded shorthands are appended to d and picked up by the same loop
+    i = 0
+    while i < len(d):
+        k, v = d[i]
+        v = intern_value(v)
+        i += 1
         try:
             processed = process_property(k, v)
             if isinstance(processed, list):
                 d.extend(processed)
             else:
-                done[k] = processed
+                # interned names hit the identity fast path of the itemgetters
+                done[sys.intern(k)] = processed
         except BugError:
             raise
         except AssertionError as e:
@@ -1148,7 +1191,12 @@ def process(d: InputStyle) -> Style:
 
 
 def compute_style(
-    tag: str, val: str | CompValue, key: str, p_style: FullyComputedStyle
+    tag: str,
+    val: str | CompValue,
+    key: str,
+    p_style: FullyComputedStyle,
+    _attrs=style_attrs,
+    _defaults=abs_default_style,
 ) -> CompValue:
     """
     Takes a tag, a property (value and key) and a style from which to inherit and returns a CompValue
@@ -1159,12 +1207,12 @@ def compute_style(
 
     if not is_real_str(val):
         return val
-    attr = style_attrs[key]
+    attr = _attrs[key]
     match val:
         case "inherit":
             return p_style[key]
         case "unset":
-            return redirect(abs_default_style[key])
+            return redirect(_defaults[key])
         case "revert":
             return (
                 redirect("inherit") if attr.inherits else redirect(get_style(tag)[key])
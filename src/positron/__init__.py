@@ -1,13 +1,30 @@
-from positron.main import Event, alert, pg, arun, run, set_config
-import positron.config
-import positron.events.InputType as InputType
-import positron.utils.Navigator as Navigator
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING
 
-from .EventManager import EventManager
-from .J import J, SingleJ
-from .Media import Image
-from .utils.aio import create_file as create_file
-from .utils.Navigator import aload_dom, aload_dom_frm_str, load_dom, load_dom_frm_str
+if TYPE_CHECKING:
+    import positron.config
+    import positron.events.InputType as InputType
+    import positron.utils.Navigator as Navigator
+
+    from .EventManager import EventManager
+    from .J import J, SingleJ
+    from .main import Event, alert, arun, run, set_config
+    from .Media import Image
+    from .utils.aio import create_file as create_file
+    from .utils.Navigator import (
+        URL,
+        aload_dom,
+        aload_dom_frm_str,
+        load_dom,
+        load_dom_frm_str,
+    )
+    from .utils.Navigator import add_route as route
+
+    event_manager: EventManager
+
+    # things that should be exported but not in __all__
+    watch_file = positron.config.file_watcher.add_file
 
 
 def quit():
@@ -16,11 +33,6 @@ def quit():
     pg.event.post(pg.event.Event(pg.QUIT))
 
 
-route = Navigator.add_route
-event_manager: EventManager = positron.config.event_manager
-URL = Navigator.URL
-
-
 def set_cwd(file: str):
     """
     Usage:
@@ -31,6 +43,69 @@ def set_cwd(file: str):
     os.chdir(os.path.dirname(os.path.abspath(file)))
 
 
+# The heavy submodules (pygame, aiohttp, jinja2, tinycss, ...) are only imported
+# when one of their names is first accessed (PEP 562).
+# name -> (module, attribute) where an attribute of None means the module itself
+_lazy_attrs: dict[str, tuple[str, str | None]] = {
+    # main
+    "Event": ("positron.main", "Event"),
+    "alert": ("positron.main", "alert"),
+    "arun": ("positron.main", "arun"),
+    "run": ("positron.main", "run"),
+    "set_config": ("positron.main", "set_config"),
+    # J
+    "J": ("positron.J", "J"),
+    "SingleJ": ("positron.J", "SingleJ"),
+    # misc
+    "config": ("positron.config", None),
+    "Image": ("positron.Media", "Image"),
+    "EventManager": ("positron.EventManager", "EventManager"),
+    "create_file": ("positron.utils.aio", "create_file"),
+    "InputType": ("positron.events.InputType", None),
+    # Navigator
+    "Navigator": ("positron.utils.Navigator", None),
+    "URL": ("positron.utils.Navigator", "URL"),
+    "route": ("positron.utils.Navigator", "add_route"),
+    "load_dom": ("positron.utils.Navigator", "load_dom"),
+    "aload_dom": ("positron.utils.Navigator", "aload_dom"),
+    "load_dom_frm_str": ("positron.utils.Navigator", "load_dom_frm_str"),
+    "aload_dom_frm_str": ("positron.utils.Navigator", "aload_dom_frm_str"),
+}
+
+
+def __getattr__(name: str):
+    import importlib
+
+    if (lazy := _lazy_attrs.get(name)) is not None:
+        module_name, attr = lazy
+        module = importlib.import_module(module_name)
+        value = module if attr is None else getattr(module, attr)
+    elif name in ("event_manager", "watch_file"):
+        # these are only set up once main is imported
+        importlib.import_module("positron.main")
+        config = importlib.import_module("positron.config")
+        value = (
+            config.event_manager
+            if name == "event_manager"
+            else config.file_watcher.add_file
+        )
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+class _PositronModule(ModuleType):
+    def __setattr__(self, name: str, value):
+        # importing the submodule positron.J would otherwise shadow the class J
+        if name == "J" and isinstance(value, ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _PositronModule
+
+
 __all__ = [
     # J
     "J",
@@ -53,8 +128,3 @@ __all__ = [
     "set_cwd",
     "route",
 ]
-
-# things that should be exported but not in __all__
-watch_file = positron.config.file_watcher.add_file
-
-del pg
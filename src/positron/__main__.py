@@ -1,14 +1,11 @@
 import sys
 
-match sys.argv[1:]:
-    case []:
-        print("Usage: positron <file>")
-    case l if "-h" in l or "--help" in l:
-        print("Usage: positron <file>")
-    case [file]:
-        from positron import set_cwd, run
+args = sys.argv[1:]
+if len(args) != 1 or "-h" in args or "--help" in args:
+    print("Usage: positron <file>")
+else:
+    from positron import set_cwd, run
 
-        set_cwd(file)
-        run(file)
-    case _:
-        print("Usage: positron <file>")
+    file = args[0]
+    set_cwd(file)
+    run(file)
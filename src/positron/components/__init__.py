@@ -2,18 +2,62 @@
 Components are small drawables that can be used all over the place
 """
 
+import math
 from dataclasses import dataclass
+from functools import lru_cache
 
+import pygame as pg
 from pygame.sprite import Sprite
 
-from positron.types import Color, ColorValue, Rect, Surface, Vector2
-from positron.utils import draw_line, draw_polygon
+from positron.types import Color, ColorValue, Rect, Surface
 
 
 class Component(Sprite):
     rect: Rect
 
 
+def _glyph_offsets(
+    is_playing: bool, size: tuple[int, int]
+) -> tuple[tuple[float, float], ...]:
+    """
+    The points of the glyph relative to the center of the rect.
+    Pause: the start and end points of the two lines, Play: the corners of the triangle
+    """
+    width, height = size
+    if is_playing:
+        dx = min(10, width) / 2
+        dy = height / 2
+        return ((dx, dy), (dx, -dy), (-dx, dy), (-dx, -dy))
+    r = min(width, height) * 0.5
+    return tuple(
+        (r * math.cos(angle), r * math.sin(angle))
+        for angle in map(math.radians, (0, 120, 240))
+    )
+
+
+@lru_cache(maxsize=32)
+def _play_button_glyph(
+    is_playing: bool,
+    size: tuple[int, int],
+    color: tuple[int, int, int, int],
+    line_width: int,
+) -> Surface:
+    """
+    Render the glyph of a PlayButton onto a transparent Surface of the given size.
+    The pixels only depend on the arguments, so the Surfaces are cached.
+    """
+    cx, cy = size[0] / 2, size[1] / 2
+    points = [(cx + x, cy + y) for x, y in _glyph_offsets(is_playing, size)]
+    glyph = Surface(size, pg.SRCALPHA)
+    if is_playing:
+        # draw two lines in the center of the rect
+        pg.draw.line(glyph, color, points[0], points[1], line_width)
+        pg.draw.line(glyph, color, points[2], points[3], line_width)
+    else:
+        pg.draw.polygon(glyph, color, points)
+    return glyph
+
+
 @dataclass
 class PlayButton(Component):
     """
@@ -30,27 +74,10 @@ class PlayButton(Component):
         self.rect = Rect((0, 0, 50, 50))
 
     def draw(self, surf: Surface):
-        if self.is_playing:
-            # draw two lines in the center of the rect
-            height = self.rect.height
-            distance = min(10, self.rect.width)
-            draw_line(
-                surf,
-                self.color,
-                Vector2(distance / 2, height / 2) + self.rect.center,
-                Vector2(distance / 2, -height / 2) + self.rect.center,
-                self.paused_line_width,
-            )
-            draw_line(
-                surf,
-                self.color,
-                Vector2(-distance / 2, height / 2) + self.rect.center,
-                Vector2(-distance / 2, -height / 2) + self.rect.center,
-                self.paused_line_width,
-            )
-        else:
-            r = min(self.rect.width, self.rect.height) * 0.5
-            vectors = (Vector2(), Vector2(), Vector2())
-            for i, angle in enumerate((0, 120, 240)):
-                vectors[i].from_polar((r, angle))
-            draw_polygon(surf, self.color, [self.rect.center + v for v in vectors])
+        glyph = _play_button_glyph(
+            self.is_playing,
+            self.rect.size,
+            tuple(Color(self.color)),
+            self.paused_line_width,
+        )
+        surf.blit(glyph, self.rect)
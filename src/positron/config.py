@@ -3,11 +3,10 @@
 import asyncio
 import math
 import re
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 from weakref import WeakSet
 
-import aiohttp
-import jinja2
 import pygame as pg
 from .types import Color, Cursor, Length, Surface, FrozenDCache
 
@@ -37,13 +36,20 @@ g: dict[str, Any] = {
     "css_sheets": WeakSet(),        # a set of used css SourceSheets
     "css_dirty": False,             # bool whether the css is dirty
     "css_sheet_len": 0,             # int
+    "css_sheet": None,              # SourceSheet | None all css_sheets joined, None when outdated
 }
 # fmt: on
 
 DEBUG = True
+# render templates with render_async (allows await inside templates but is much slower)
+# it is read when config.jinja_env is first created, set it before loading any page
+jinja_async = False
 
 # We avoid circular references by using if TYPE_CHECKING
 if TYPE_CHECKING:
+    import aiohttp
+    import jinja2
+
     from positron.EventManager import EventManager
     from positron.utils import Task
     from positron.utils.FileWatcher import FileWatcher
@@ -52,9 +58,9 @@ if TYPE_CHECKING:
     file_watcher: FileWatcher
     default_task: Task
     tasks: list[Task]
+    jinja_env: jinja2.Environment  # The global jinja Environment used for all html loading
+    aiosession: aiohttp.ClientSession  # The global aiohttp session used for http requests
 tasks = []
-jinja_env: jinja2.Environment  # The global jinja Environment used for all html loading
-aiosession: aiohttp.ClientSession  # The global aiohttp session used for http requests
 event_loop: asyncio.AbstractEventLoop  # The global asyncio event loop
 screen: Surface
 
@@ -64,44 +70,54 @@ def add_sheet(sheet: Any):
     Add a sheet to the global css_sheets
     """
     g["css_sheets"].add(sheet)
+    g["css_sheet"] = None
     g["css_dirty"] = True
 
 
 ################################ constant data ########################
+# read-only lookup tables are wrapped in a MappingProxyType
 
 # font-size
-abs_font_size = {
-    "xx-small": -3,
-    "x-small": -2,
-    "small": -1,
-    "medium": 0,
-    "large": 1,
-    "x-large": 2,
-    "xx-large": 3,
-    "xxx-large": 4,
-}
-rel_font_size = {"smaller": -1, "larger": 1}
+abs_font_size = MappingProxyType(
+    {
+        "xx-small": -3,
+        "x-small": -2,
+        "small": -1,
+        "medium": 0,
+        "large": 1,
+        "x-large": 2,
+        "xx-large": 3,
+        "xxx-large": 4,
+    }
+)
+rel_font_size = MappingProxyType({"smaller": -1, "larger": 1})
 # font_weight
-abs_font_weight = {
-    "normal": 400,
-    "bold": 700,
-}
+abs_font_weight = MappingProxyType(
+    {
+        "normal": 400,
+        "bold": 700,
+    }
+)
 # border-width
-abs_border_width = {
-    # copied from firefox
-    "thin": Length(1),
-    "medium": Length(3),
-    "thick": Length(5),
-}
-abs_length_units = {
-    "px": 1,
-    "cm": 37.8,
-    "mm": 3.78,
-    "Q": 0.945,
-    "in": 96,
-    "pc": 16,
-    "pt": 4 / 3,
-}
+abs_border_width = MappingProxyType(
+    {
+        # copied from firefox
+        "thin": Length(1),
+        "medium": Length(3),
+        "thick": Length(5),
+    }
+)
+abs_length_units = MappingProxyType(
+    {
+        "px": 1,
+        "cm": 37.8,
+        "mm": 3.78,
+        "Q": 0.945,
+        "in": 96,
+        "pc": 16,
+        "pt": 4 / 3,
+    }
+)
 rel_length_units = {
     "cap",
     "ch",
@@ -134,47 +150,61 @@ abs_time_units = {"s": 1, "ms": 1 / 1000}
 # }
 abs_resolution_units = {"dpi": 1, "dpcm": 2.54, "x": 96, "dppx": 96}
 
-cursors = {
-    "default": Cursor(),
-    # the cursor just vanishes by setting the smallest possible size full of zeros
-    "none": Cursor((8, 8), (0, 0), (0,) * 8, (0,) * 8),
-    # TODO: context-menu
-    # TODO: help
-    "pointer": Cursor(pg.SYSTEM_CURSOR_HAND),
-    "progress": Cursor(pg.SYSTEM_CURSOR_WAITARROW),
-    "wait": Cursor(pg.SYSTEM_CURSOR_WAIT),
-    # TODO: cell
-    "crosshair": Cursor(pg.SYSTEM_CURSOR_CROSSHAIR),
-    "text": Cursor(pg.SYSTEM_CURSOR_IBEAM),
-    # TODO: vertical text
-    # TODO: alias, copy
-    "move": Cursor(pg.SYSTEM_CURSOR_SIZEALL),
-    "not-allowed": Cursor(pg.SYSTEM_CURSOR_NO),
-    # TODO: grab, grabbing
-    # resize arrows are symmetrical
-    "n-resize": Cursor(pg.SYSTEM_CURSOR_SIZENS),
-    "e-resize": Cursor(pg.SYSTEM_CURSOR_SIZEWE),
-    "s-resize": Cursor(pg.SYSTEM_CURSOR_SIZENS),
-    "w-resize": Cursor(pg.SYSTEM_CURSOR_SIZEWE),
-    "ne-resize": Cursor(pg.SYSTEM_CURSOR_SIZENESW),
-    "nw-resize": Cursor(pg.SYSTEM_CURSOR_SIZENWSE),
-    "se-resize": Cursor(pg.SYSTEM_CURSOR_SIZENWSE),
-    "sw-resize": Cursor(pg.SYSTEM_CURSOR_SIZENESW),
-    "ew-resize": Cursor(pg.SYSTEM_CURSOR_SIZEWE),
-    "ns-resize": Cursor(pg.SYSTEM_CURSOR_SIZENS),
-    "nesw-resize": Cursor(pg.SYSTEM_CURSOR_SIZENESW),
-    "nwse-resize": Cursor(pg.SYSTEM_CURSOR_SIZENWSE),
-    # TODO: zoom-in and -out
-}
+# the resize arrows are symmetrical, so opposite directions share one Cursor
+_sizens = Cursor(pg.SYSTEM_CURSOR_SIZENS)
+_sizewe = Cursor(pg.SYSTEM_CURSOR_SIZEWE)
+_sizenesw = Cursor(pg.SYSTEM_CURSOR_SIZENESW)
+_sizenwse = Cursor(pg.SYSTEM_CURSOR_SIZENWSE)
 
-input_type_check_res = {
-    **dict.fromkeys(("text", "password", "tel", "search"), re.compile(r".*")),
-    "number": re.compile(r"[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?"),
-    "email": re.compile(
-        r"[\w\d.!#$%&'*+/=?^_`{|}~-]+@[\w\d](?:[\w\d-]{0,61}[\w\d])?(?:\.[\w\d](?:[-\w\d]{0,61}[\w\d])?)*"
-    ),
-    "url": re.compile(r".*"),
-}
+cursors = MappingProxyType(
+    {
+        "default": Cursor(),
+        # the cursor just vanishes by setting the smallest possible size full of zeros
+        "none": Cursor((8, 8), (0, 0), (0,) * 8, (0,) * 8),
+        # TODO: context-menu
+        # TODO: help
+        "pointer": Cursor(pg.SYSTEM_CURSOR_HAND),
+        "progress": Cursor(pg.SYSTEM_CURSOR_WAITARROW),
+        "wait": Cursor(pg.SYSTEM_CURSOR_WAIT),
+        # TODO: cell
+        "crosshair": Cursor(pg.SYSTEM_CURSOR_CROSSHAIR),
+        "text": Cursor(pg.SYSTEM_CURSOR_IBEAM),
+        # TODO: vertical text
+        # TODO: alias, copy
+        "move": Cursor(pg.SYSTEM_CURSOR_SIZEALL),
+        "not-allowed": Cursor(pg.SYSTEM_CURSOR_NO),
+        # TODO: grab, grabbing
+        "n-resize": _sizens,
+        "e-resize": _sizewe,
+        "s-resize": _sizens,
+        "w-resize": _sizewe,
+        "ne-resize": _sizenesw,
+        "nw-resize": _sizenwse,
+        "se-resize": _sizenwse,
+        "sw-resize": _sizenesw,
+        "ew-resize": _sizewe,
+        "ns-resize": _sizens,
+        "nesw-resize": _sizenesw,
+        "nwse-resize": _sizenwse,
+        # TODO: zoom-in and -out
+    }
+)
+
+# the patterns are compiled once and shared between the input types
+_any_re = re.compile(r".*")
+_number_re = re.compile(r"[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?")
+_email_re = re.compile(
+    r"[\w\d.!#$%&'*+/=?^_`{|}~-]+@[\w\d](?:[\w\d-]{0,61}[\w\d])?(?:\.[\w\d](?:[-\w\d]{0,61}[\w\d])?)*"
+)
+
+input_type_check_res = MappingProxyType(
+    {
+        **dict.fromkeys(("text", "password", "tel", "search"), _any_re),
+        "number": _number_re,
+        "email": _email_re,
+        "url": _any_re,
+    }
+)
 
 default_text_input_size = "20"
 password_replace_char = "•"
@@ -252,3 +282,16 @@ generic_font_families = {
 
 scroll_factor = -10
 alt_scroll_factor = -100
+
+
+def __getattr__(name: str):
+    # jinja2 is only imported when the first page is rendered
+    if name == "jinja_env":
+        import jinja2
+
+        global jinja_env
+        jinja_env = jinja2.Environment(
+            loader=jinja2.loaders.FileSystemLoader("."), enable_async=jinja_async
+        )
+        return jinja_env
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,7 +8,7 @@ from __future__ import annotations
 # from keyword import iskeyword
 from contextlib import suppress
 from dataclasses import dataclass, field
-from typing import Any, Iterable, Protocol
+from typing import Any, Generic, Iterable, Mapping, MutableMapping
 
 import positron.types as types
 import positron.utils as util
@@ -20,7 +20,7 @@ from positron.config import input_type_check_res
 #         setattr(elem, name, attr)
 
 
-@dataclass
+@dataclass(slots=True)
 class Opposite:
     attr: str
 
@@ -28,7 +28,7 @@ class Opposite:
         return not getattr(obj, self.attr)
 
 
-@dataclass
+@dataclass(slots=True)
 class SameAs:
     attr: str
 
@@ -36,26 +36,34 @@ class SameAs:
         return getattr(obj, self.attr)
 
 
-class Attribute(Protocol[types.V_T]):
+_missing: Any = object()
+
+
+class Attribute(Generic[types.V_T]):
     """
     The base class for all attributes.
     Automatically returns the default if it cannot be found
     when getting the attribute from the elements attrs
     """
 
+    __slots__ = ()
+
     attr: str
     default: types.V_T
 
     def get_default(self, elem):
         return self.default
 
-    def _get(self, elem: types.Element_P) -> types.V_T:
+    def _get(self, elem: types.Element_P, value: str) -> types.V_T:
+        """
+        Convert the raw value found in the elements attrs
+        """
         ...
 
     def __get__(self, elem: types.Element_P, type=None) -> types.V_T:
-        if self.attr not in elem.attrs:
+        if (value := elem.attrs.get(self.attr, _missing)) is _missing:
             return self.get_default(elem)
-        return self._get(elem)
+        return self._get(elem, value)
 
     def __set__(self, elem: types.Element_P, value: types.V_T):
         ...
@@ -64,7 +72,7 @@ class Attribute(Protocol[types.V_T]):
         del elem.attrs[self.attr]
 
 
-@dataclass
+@dataclass(slots=True)
 class GeneralAttribute(Attribute[str]):
     """
     Just passes the dict value up.
@@ -73,14 +81,14 @@ class GeneralAttribute(Attribute[str]):
     attr: str
     default: str = ""
 
-    def _get(self, elem):
-        return elem.attrs[self.attr]
+    def _get(self, elem, value):
+        return value
 
     def __set__(self, elem, value):
         elem.attrs[self.attr] = value
 
 
-@dataclass
+@dataclass(slots=True)
 class EnumeratedAttribute(Attribute[str]):
     """
     An enumerated attribute with a certain, predefined set of possible values
@@ -96,28 +104,28 @@ class EnumeratedAttribute(Attribute[str]):
     def correct(self, x: Any):
         return x if x in self.range else self.default
 
-    def _get(self, elem):
-        return self.correct(elem.attrs[self.attr])
+    def _get(self, elem, value):
+        return self.correct(value)
 
     def __set__(self, elem, value):
         elem.attrs[self.attr] = self.correct(value)
 
 
-@dataclass
+@dataclass(slots=True)
 class NumberAttribute(Attribute[float]):
     attr: str
     default: float = 0
 
-    def _get(self, elem: types.Element_P):
+    def _get(self, elem: types.Element_P, value: str):
         with suppress(ValueError):
-            return float(elem.attrs[self.attr])
+            return float(value)
         return self.default
 
     def __set__(self, elem: types.Element_P, value: float):
         elem.attrs[self.attr] = util.nice_number(value)
 
 
-@dataclass
+@dataclass(slots=True)
 class BooleanAttribute(Attribute[bool]):
     """
     Get the boolean of an attribute.
@@ -136,39 +144,71 @@ class BooleanAttribute(Attribute[bool]):
     attr: str
     default: bool = False
 
-    def _get(self, elem):
-        return elem.attrs[self.attr] != "false"
+    def _get(self, elem, value):
+        return value != "false"
 
     def __set__(self, elem, value: bool):
         if value:
-            elem.attrs[self.attr] == ""
+            elem.attrs[self.attr] = ""
         else:
-            del elem.attrs[self.attr]
+            elem.attrs.pop(self.attr, None)
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassListAttribute(Attribute[Iterable[str]]):
     attr: str = "class"
     default: set[str] = field(default_factory=set)
 
-    def _get(self, elem):
-        return set(elem.attrs[self.attr].split())
+    def _get(self, elem, value):
+        return set(value.split())
 
     def __set__(self, elem, value):
         elem.attrs[self.attr] = " ".join(value)
 
 
-@dataclass
-class DataAttribute(Attribute[dict[str, str]]):
+class DataView(MutableMapping[str, str]):
+    """
+    A live view of the data-* attributes of an element (like the dataset in JS).
+    Nothing is copied, every access goes straight through to the elements attrs.
+    """
+
+    __slots__ = ("attrs",)
+
+    prefix = "data-"
+
+    def __init__(self, attrs: dict[str, str]):
+        self.attrs = attrs
+
+    def __getitem__(self, key: str) -> str:
+        return self.attrs[self.prefix + key]
+
+    def __setitem__(self, key: str, value: str):
+        self.attrs[self.prefix + key] = value
+
+    def __delitem__(self, key: str):
+        del self.attrs[self.prefix + key]
+
+    def __iter__(self):
+        prefix = self.prefix
+        return (k[len(prefix) :] for k in self.attrs if k.startswith(prefix))
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({dict(self)})"
+
+
+@dataclass(slots=True)
+class DataAttribute(Attribute[DataView]):
     attr: str = "data"  # this isn't actually True
-    default: dict[str, str] = field(default_factory=dict)
 
-    def _get(self, elem):
-        return {k[5:]: v for k, v in elem.attrs.items() if k.startswith("data-")}
+    def __get__(self, elem, type=None):
+        # the data is spread over several attributes, so there is no single key to look up
+        return DataView(elem.attrs)
 
-    def __set__(self, elem, value: dict[str, str]):
-        for k, v in value.items():
-            elem.attrs[f"data-{k}"] = v
+    def __set__(self, elem, value: Mapping[str, str]):
+        DataView(elem.attrs).update(value)
 
 
 # # Very specialized Attributes
@@ -179,7 +219,7 @@ class DataAttribute(Attribute[dict[str, str]]):
 #     # TODO: think about what needs to happen if the elements type changes
 
 
-@dataclass
+@dataclass(slots=True)
 class InputValueAttribute(Attribute[str | float]):
     attr: str = "value"
 
@@ -193,14 +233,14 @@ class InputValueAttribute(Attribute[str | float]):
         else:
             raise NotImplementedError
 
-    def _get(self, elem):
+    def _get(self, elem, value):
         if elem.type == "number":
             try:
-                return float(elem.attrs[self.attr])
+                return float(value)
             except ValueError:
                 return self.get_default(elem)
         else:
-            return elem.attrs[self.attr]
+            return value
 
     def __set__(self, elem, value: str | float):
         elem.attrs[self.attr] = (
@@ -212,6 +252,7 @@ __all__ = [
     "BooleanAttribute",
     "ClassListAttribute",
     "DataAttribute",
+    "DataView",
     "GeneralAttribute",
     "InputValueAttribute",
     "NumberAttribute",
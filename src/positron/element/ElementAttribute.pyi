@@ -1,3 +1,5 @@
+from typing import Iterator, MutableMapping
+
 def Opposite(attr: str) -> bool: ...
 def SameAs(attr: str): ...
 def GeneralAttribute(attr: str, default: str = "") -> str: ...
@@ -5,7 +7,14 @@ def EnumeratedAttribute(attr: str, range: set[str], default: str = "") -> str: .
 def NumberAttribute(attr: str, default: float = 0) -> float: ...
 def BooleanAttribute(attr: str, default: bool = False) -> bool: ...
 def ClassListAttribute(attr: str = "class", default: set[str] = set()) -> set[str]: ...
-def DataAttribute(
-    attr: str = "data", default: dict[str, str] = dict()
-) -> dict[str, str]: ...
+
+class DataView(MutableMapping[str, str]):
+    def __init__(self, attrs: dict[str, str]) -> None: ...
+    def __getitem__(self, key: str) -> str: ...
+    def __setitem__(self, key: str, value: str) -> None: ...
+    def __delitem__(self, key: str) -> None: ...
+    def __iter__(self) -> Iterator[str]: ...
+    def __len__(self) -> int: ...
+
+def DataAttribute(attr: str = "data") -> MutableMapping[str, str]: ...
 def InputValueAttribute(attr: str = "value", default: str = "") -> str: ...
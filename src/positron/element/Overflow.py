@@ -8,25 +8,27 @@ Overflow values can be:
 - visible:  don't clip and no scroll
 """
 
-from contextlib import contextmanager, nullcontext
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass
+from types import MappingProxyType
 
 from positron.types import Surface, Rect
 from positron.utils.func import in_bounds
 from positron.utils.pg import surf_clip
 
 
-@dataclass(frozen=True)
+# nullcontext is reusable, so one instance is enough
+_null_ctx = nullcontext()
+
+
+@dataclass(frozen=True, slots=True)
 class Overflow:
     scroll: bool = True
     user_scroll: bool = True
     clip: bool = True
 
-    @contextmanager
-    def clip_surf(self, surf: Surface, clip: Rect):
-        inner_ctx = surf_clip(surf, clip) if self.clip else nullcontext()
-        with inner_ctx:
-            yield
+    def clip_surf(self, surf: Surface, clip: Rect) -> AbstractContextManager:
+        return surf_clip(surf, clip) if self.clip else _null_ctx
 
     def calc_scroll(self, scroll: float, max_scroll: float) -> float:
         if not self.scroll:
@@ -34,9 +36,11 @@ class Overflow:
         return in_bounds(scroll, 0, max_scroll)
 
 
-overflow = {
-    "scroll": Overflow(),
-    "hidden": Overflow(user_scroll=False),
-    "clip": Overflow(scroll=False, user_scroll=False),
-    "visible": Overflow(scroll=False, user_scroll=False, clip=False),
-}
+overflow = MappingProxyType(
+    {
+        "scroll": Overflow(),
+        "hidden": Overflow(user_scroll=False),
+        "clip": Overflow(scroll=False, user_scroll=False),
+        "visible": Overflow(scroll=False, user_scroll=False, clip=False),
+    }
+)
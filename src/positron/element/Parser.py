@@ -1,16 +1,29 @@
+import sys
+from functools import lru_cache
+
 import html5lib
 
+# building the parser and looking up the tree builder is only done once
+# the parser resets itself on every parse, so it can be reused
+_parser = html5lib.HTMLParser(tree=html5lib.getTreeBuilder("etree"))
+
+_XHTML_NS = "{http://www.w3.org/1999/xhtml}"
+_COMMENT = sys.intern("!comment")
+
 
 def parse(html: str):
-    return html5lib.parse(html)
+    return _parser.parse(html)
+
+
+@lru_cache(maxsize=256)
+def _normalize_tag(tag: str) -> str:
+    # there are only a few different tags, so this is mostly a cache hit
+    # the tags are interned because they are used as keys all over the place
+    return sys.intern(tag.removeprefix(_XHTML_NS).lower())
 
 
 def get_tag(elem) -> str:
     """
     Get the tag of an _XMLElement or "comment" if the element has no valid tag
     """
-    return (
-        elem.tag.removeprefix("{http://www.w3.org/1999/xhtml}").lower()
-        if isinstance(elem.tag, str)
-        else "!comment"
-    )
+    return _normalize_tag(elem.tag) if isinstance(elem.tag, str) else _COMMENT
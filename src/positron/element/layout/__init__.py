@@ -14,8 +14,8 @@ If in the original DOM, block and layout childrens are mixed, we put the inline
 
 from __future__ import annotations
 
-from collections import deque
 from dataclasses import dataclass
+from itertools import groupby
 from typing import Iterable, Protocol, Sequence
 
 import positron.element.layout.text_align as text_align
@@ -27,7 +27,6 @@ from positron.style.itemgetters import inset_getter
 # fmt: off
 from positron.types import Auto, AutoLP4Tuple, Coordinate, Float4Tuple, Rect,Surface
 # fmt: on
-from positron.utils.func import group_by_bool
 
 
 def calc_inset(inset: AutoLP4Tuple, width: float, height: float) -> Float4Tuple:
@@ -51,6 +50,9 @@ Every InlineElement is a wrapper over one Element.
 
 
 class InlineItem:
+    # elem is a field of the subclasses
+    __slots__ = ("rect", "abs_rect")
+
     rect: Rect
     elem: Element
 
@@ -73,17 +75,18 @@ class InlineItem:
         """
 
 
-@dataclass
+@dataclass(slots=True)
 class InlineText(InlineItem):
     text: str
     elem: Element
     whitespace: bool = True
 
     def layout(self, _):
-        width = (
-            self.elem.font.size(self.text)[0] + self.whitespace * self.elem.word_spacing
-        )
-        self.rect = Rect((0, 0), (width, self.elem.line_height))
+        elem = self.elem
+        width = elem.font.size(self.text)[0]
+        if self.whitespace:
+            width += elem.word_spacing
+        self.rect = Rect(0, 0, width, elem.line_height)
 
     def draw(self, surf: Surface):
         # _descent = next(iter(self.elem.font._fonts_for_chars(self.text)))[
@@ -101,8 +104,10 @@ class InlineText(InlineItem):
         self.abs_rect = self.rect.move(pos)  # type: ignore
 
 
-@dataclass(init=False)
+@dataclass(init=False, slots=True)
 class InlineElement(InlineItem):
+    elem: Element
+
     def __init__(self, element: Element):
         self.elem = element
 
@@ -194,57 +199,55 @@ class InlineLayout(RealLayout):
             if isinstance(elem, Element):
                 items.append(InlineElement(elem))
             elif isinstance(elem, TextElement):
-                text_items = [InlineText(w, elem.parent) for w in elem.text.split()]
+                parent = elem.parent
+                text_items = [InlineText(w, parent) for w in elem.words]
                 if not text_items:
                     if items and isinstance(last_text_item := items[-1], InlineText):
                         last_text_item.whitespace = True
                     continue
-                last_item = text_items[-1]
-                if elem.text.endswith(last_item.text):
-                    last_item.whitespace = False
-                items.extend(filter(None, text_items))
+                # the last word only has whitespace if the text ends with it
+                text_items[-1].whitespace = elem.text[-1:].isspace()
+                items.extend(text_items)
         self.items = items
 
     def layout(self, width: float):
         x = 0
         y = 0
-
+        # the alignment is the same for every line
+        align = self.elem.aligner
         current_line: list[InlineItem] = []
-
-        def line_break():
-            nonlocal x, y
-            if current_line:
-                height = max(item.rect.height for item in current_line)
-                widths = [item.rect.width for item in current_line]
-                alignment = text_align.align_by(
-                    self.elem.cstyle["text-align"], width, widths
-                )
-                assert len(widths) == len(alignment)
-                for newx, item in zip(alignment, current_line):
-                    item.rect.x = newx
-                    item.rect.y = y
-                x = 0
-                y += height
-                current_line.clear()
-
         for item in self.items:
             item.layout(width)
-            if x + item.rect.width > width:
-                line_break()
+            if x + item.rect.width > width and current_line:
+                y += self._place_line(current_line, y, width, align)
+                current_line = []
+                x = 0
             item.rect.left = x
             x += item.rect.width
             current_line.append(item)
-
-        line_break()
+        if current_line:
+            y += self._place_line(current_line, y, width, align)
         self.height = y
         box = self.elem.box
         if box.height == -1:
             box.set_height(y, "content")
         return self
 
-    def draw(self, surf: Surface):
-        super().draw(surf)
-        ...  # TODO: draw outlines
+    @staticmethod
+    def _place_line(
+        line: list[InlineItem], y: float, width: float, align: text_align.TextAlign
+    ) -> float:
+        """
+        Aligns the items of one line and moves them to y.
+        Returns the height of the line
+        """
+        widths = [item.rect.width for item in line]
+        alignment = align(width, widths)
+        assert len(widths) == len(alignment)
+        for newx, item in zip(alignment, line):
+            item.rect.x = newx
+            item.rect.y = y
+        return max(item.rect.height for item in line)
 
     def collide(self, pos):
         for item in self.items:
@@ -255,6 +258,9 @@ class InlineLayout(RealLayout):
 
 Child = Element | TextElement
 
+# positions that take part in the normal flow
+_FLOW_POS = frozenset(("static", "relative", "sticky"))
+
 
 def margin_collapsing(last: float, current: float):
     # XXX: There is no float, clear and no negative margins
@@ -268,60 +274,61 @@ class BlockLayout(RealLayout):
 
     def __init__(self, elem: Element, children: list[Child]) -> None:
         self.elem = elem
-        items = deque[Element | VirtualBlock]()
-        children: deque[Child] = deque(children)
-        inline_elements = deque[Child]()
-
-        # ugly but okay
-        while children:
-            while children and children[0].display == "inline":
-                inline_elements.append(children.popleft())
-            if inline_elements:
-                items.append(VirtualBlock(elem, list(inline_elements)))
-                inline_elements.clear()
-            while children and children[0].display == "block":
-                child = children.popleft()
-                assert not isinstance(child, TextElement)
-                items.append(child)
-
-        self.items = [item for item in items if item]
+        items: list[Element | VirtualBlock] = []
+        # runs of inline children are grouped into VirtualBlocks
+        for is_inline, group in groupby(children, lambda c: c.display == "inline"):
+            if is_inline:
+                if virtual_block := VirtualBlock(elem, list(group)):
+                    items.append(virtual_block)
+            else:
+                items.extend(group)  # type: ignore[arg-type]
+        self.items = items
 
     def layout(self, width: float):
         box = self.elem.box
         inner: Rect = box.content_box
         # https://developer.mozilla.org/en-US/docs/Web/CSS/CSS_Box_Model/Mastering_margin_collapsing
-        flow, no_flow = group_by_bool(
-            self.items,
-            lambda x: x.position in ("static", "relative", "sticky"),
-        )
+        padding, border, margin = box.padding, box.border, box.margin
+        # margins only collapse through the edges without padding and border
+        collapse_top = not padding[Box.top] and not border[Box.top]
+        collapse_bottom = not padding[Box.bottom] and not border[Box.bottom]
         y_cursor: float = 0
         last_margin: float = 0
-        if flow:
-            # margin-collapsing with margin-top of first child
-            if not box.padding[Box.top] and not box.border[Box.top]:
-                last_margin = box.margin[0]
-            for child in flow:
-                child.layout(inner.width)
-                current_margin = child.box.margin
-                # margin collapsing for empty boxes
-                if child.box.border_box.height == 0:
-                    y_cursor -= margin_collapsing(*current_margin[Box._vertical])  # type: ignore
-                y_cursor -= margin_collapsing(last_margin, current_margin[Box.top])
-                last_margin = current_margin[Box.bottom]
-                child.box.set_pos((0, y_cursor))
-                y_cursor += child.box.outer_box.height
+        has_flow = False
+        no_flow: list[Element | VirtualBlock] = []
+        for child in self.items:
+            if child.position not in _FLOW_POS:
+                no_flow.append(child)
+                continue
+            if not has_flow:
+                has_flow = True
+                # margin-collapsing with margin-top of first child
+                if collapse_top:
+                    last_margin = margin[Box.top]
+            child.layout(inner.width)
+            current_margin = child.box.margin
+            # margin collapsing for empty boxes
+            if child.box.border_box.height == 0:
+                y_cursor -= margin_collapsing(*current_margin[Box._vertical])  # type: ignore
+            y_cursor -= margin_collapsing(last_margin, current_margin[Box.top])
+            last_margin = current_margin[Box.bottom]
+            child.box.set_pos((0, y_cursor))
+            y_cursor += child.box.outer_box.height
         if box.height == -1:
             # margin-collapsing with margin-bottom of last child
-            if not box.padding[Box.bottom] and not box.border[Box.bottom]:
-                y_cursor -= margin_collapsing(last_margin, box.margin[Box.bottom])
+            if collapse_bottom:
+                y_cursor -= margin_collapsing(last_margin, margin[Box.bottom])
             box.set_height(y_cursor, "content")
         self.height = y_cursor
+        if not no_flow:
+            return
+        # the insets only depend on this element
+        top, bottom, right, left = calc_inset(
+            inset_getter(self.elem.cstyle), box.width, box.height
+        )
         for child in no_flow:
             child.layout(inner.width)
             # calculate position
-            top, bottom, right, left = calc_inset(
-                inset_getter(self.elem.cstyle), box.width, box.height
-            )
             child.box.set_pos(
                 (
                     (
@@ -361,6 +368,8 @@ class VirtualBlock:
     Then layouts and renders them
     """
 
+    __slots__ = ("elem", "items", "box", "inline_layout")
+
     display = "block"
     position = "static"
 
@@ -395,7 +404,7 @@ class VirtualBlock:
         return self.inline_layout.collide(pos)
 
     def __getattr__(self, name: str):
-        if name in ("cstyle",):
+        if name in ("cstyle", "aligner"):
             return getattr(self.elem, name)
         return NotImplemented
 
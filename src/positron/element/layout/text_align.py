@@ -7,6 +7,7 @@ left, right, center, justify
 
 """
 
+from itertools import accumulate
 from typing import Iterable, Protocol
 
 
@@ -21,35 +22,39 @@ def space_left(max_width, widths):
     return max_width - sum(widths)
 
 
-def _left(widths):
-    acc = 0
-    for w in widths:
-        yield acc
-        acc = acc + w
+def _left(widths: list[float]) -> list[float]:
+    """
+    The left aligned x position of every word (the running sum of the widths before it)
+    """
+    return list(accumulate(widths[:-1], initial=0)) if widths else []
 
 
 def left(max_width, widths):
-    return [*_left(widths)]
+    return _left(widths)
 
 
 def right(max_width, widths):
-    l = [*_left(widths)]
     rem = space_left(max_width, widths)
-    return [x + rem for x in l]
+    return [x + rem for x in _left(widths)]
 
 
 def center(max_width, widths):
-    l = [*_left(widths)]
     rem = space_left(max_width, widths) / 2
-    return [x + rem for x in l]
-    return [x + rem for x, width in zip(l, widths)]
+    return [x + rem for x in _left(widths)]
 
 
 def justify(max_width, widths):
-    l = [*_left(widths)]
-    rem = space_left(max_width, widths) / (len(l) - 1)
-    return [x + rem * i for i, x in enumerate(l)]
+    rem = space_left(max_width, widths) / (len(widths) - 1)
+    return [x + rem * i for i, x in enumerate(_left(widths))]
+
+
+aligners: dict[str, TextAlign] = {
+    "left": left,
+    "right": right,
+    "center": center,
+    "justify": justify,
+}
 
 
 def align_by(alignment, max_width: float, widths: list[float]) -> list[float]:
-    return globals()[alignment](max_width, widths)
+    return aligners[alignment](max_width, widths)
@@ -17,14 +17,16 @@ cursor positions are always equal to the position of the character after the cur
 """
 
 import re
+from bisect import bisect_right
 from dataclasses import dataclass
-from typing import Protocol, TYPE_CHECKING, cast
+from functools import cached_property
+from types import MappingProxyType
+from typing import Protocol, TYPE_CHECKING
 from enum import auto
 
 from positron.types import Enum
-import positron.utils as utils
 from positron.utils.History import History as _History
-from positron.utils.regex import GeneralParser, whitespace_re
+from positron.utils.regex import whitespace_re
 
 
 __all__ = [
@@ -56,16 +58,6 @@ class EditingMethod(Enum):
     """ Drag and Drop with the mouse """
 
 
-class _ApplyDescriptor:
-    def __get__(self, obj, type=None) -> str:
-        apply = getattr(obj, "apply")
-        rv = apply(getattr(obj, "before"))
-        setattr(obj, "after", rv)
-        return rv
-
-
-ApplyDescriptor = cast(type[str], _ApplyDescriptor)
-
 # @dataclass
 # class Void:
 #     before: str
@@ -99,7 +91,10 @@ class Insert:
         return self.pos if isinstance(self.pos, int) else self.pos[1]
 
     def apply(self, text: str) -> str:
-        return "".join([*text[: self.start], *self.content, *text[self.end :]])
+        # resolve both bounds with a single type check
+        pos = self.pos
+        start, end = (pos, pos) if isinstance(pos, int) else pos
+        return text[:start] + self.content + text[end:]
 
     def is_insert(self) -> bool:
         return isinstance(self.pos, int)
@@ -108,12 +103,19 @@ class Insert:
         return isinstance(self.pos, tuple)
 
     before: str
-    after = ApplyDescriptor()
+
+    @cached_property
+    def after(self) -> str:
+        return self.apply(self.before)
 
 
 _ctrl_ident_re = re.compile(r"[\w_]+|.")
 
 
+def _is_ident_char(c: str) -> bool:
+    return c.isalnum() or c == "_"
+
+
 # TODO: Probably join Delete into Insert. A Delete is technically just a Replace with content="".
 
 
@@ -148,6 +150,14 @@ class Delete:
         Shift+Del
         """
 
+    # how far a single character deletion reaches to the left and right of pos
+    _content_offsets = MappingProxyType(
+        {
+            Direction.Back: (-1, 0),
+            Direction.For: (0, 1),
+        }
+    )
+
     # int or range depending on thing
     pos: int | tuple[int, int]
     what: What
@@ -160,34 +170,40 @@ class Delete:
                 if isinstance(self.pos, tuple):
                     frm, to = self.pos
                 else:
-                    frm = to = self.pos
-                    match self.dir:
-                        case Delete.Direction.Back:
-                            frm -= 1
-                        case Delete.Direction.For:
-                            to += 1
-                        case _:
-                            raise NotImplementedError
+                    if (offsets := Delete._content_offsets.get(self.dir)) is None:
+                        raise NotImplementedError
+                    frm, to = self.pos + offsets[0], self.pos + offsets[1]
                 return text[:frm] + text[to:]
             case Delete.What.Word:
                 assert isinstance(self.pos, int)
-                if self.dir == Delete.Direction.For:
+                if self.dir is Delete.Direction.For:
                     # "rea|dy, set, go" -> "rea, set, go"
-                    parser = GeneralParser(text[self.pos :])
-                    if not parser.consume(whitespace_re):
-                        parser.consume(_ctrl_ident_re)
-                    return parser.x
-                elif self.dir == Delete.Direction.Back:
+                    # match in place instead of slicing the text into a parser
+                    match = whitespace_re.match(text, self.pos) or _ctrl_ident_re.match(
+                        text, self.pos
+                    )
+                    end = match.end() if match else self.pos
+                    return text[: self.pos] + text[end:]
+                elif self.dir is Delete.Direction.Back:
                     # "rea|dy, set, go" -> "dy, set, go"
-                    parser = GeneralParser(text[: self.pos][::-1])
-                    parser.consume(whitespace_re)
-                    parser.consume(_ctrl_ident_re)
-                    return parser.x[::-1]
+                    # walk backwards from the cursor instead of reversing the text
+                    start = self.pos
+                    while start and text[start - 1].isspace():
+                        start -= 1
+                    if start and _is_ident_char(text[start - 1]):
+                        while start and _is_ident_char(text[start - 1]):
+                            start -= 1
+                    elif start:
+                        start -= 1
+                    return text[:start] + text[self.pos :]
             case _:
                 raise NotImplementedError
 
     before: str = ""
-    after = ApplyDescriptor()
+
+    @cached_property
+    def after(self) -> str:
+        return self.apply(self.before)
 
 
 @dataclass
@@ -206,11 +222,11 @@ class History:
 
     @classmethod
     def from_history(cls, type: Type, history: _History):
-        after = history.peek_back() if type == History.Type.Undo else history.forward()
+        after = history.peek_back() if type is History.Type.Undo else history.forward()
         return cls(type, history.current, after[0])
 
     def execute(self, history: _History):
-        if self.type == History.Type.Undo:
+        if self.type is History.Type.Undo:
             history.back()
         else:
             history.forward()
@@ -258,33 +274,48 @@ class EditingContext(_History[tuple[str, int, Selection]]):
                 return selection
         return None
 
+    # the indices at which the value differs from the entry before
+    _changes: list[int]
+
+    def _run_start(self) -> int:
+        """
+        The index at which the current value was entered
+        """
+        return self._changes[bisect_right(self._changes, self.cur) - 1]
+
+    def _next_change(self) -> int | None:
+        """
+        The index of the first later entry with another value
+        """
+        i = bisect_right(self._changes, self.cur)
+        return self._changes[i] if i < len(self._changes) else None
+
     def peek_back(self):
-        value = self.value
-        for x in self[: self.cur][::-1]:
-            if x[0] != value:
-                return x
-        return self.current
+        start = self._run_start()
+        return self[start - 1] if start else self.current
 
     def peek_for(self):
-        value = self.value
-        for x in utils.after(self, self.cur):
-            if x[0] != value:
-                return x
-        return x
+        nxt = self._next_change()
+        return self[-1] if nxt is None else self[nxt]
 
     def back(self):
-        value = self.value
-        for i in range(self.cur)[::-1]:
-            if self[i][0] != value:
-                self.cur = i
-                return
+        if start := self._run_start():
+            self.cur = start - 1
 
     def forward(self):
-        value = self.value
-        while self.current[0] == value and self.cur < len(self) - 1:
-            super().forward()
+        nxt = self._next_change()
+        self.cur = len(self) - 1 if nxt is None else nxt
+
+    def add_entry(self, entry: tuple[str, int, Selection]):
+        changes = self._changes
+        # the entries after the current one are dropped
+        del changes[bisect_right(changes, self.cur) :]
+        if not self or entry[0] != self.value:
+            changes.append(self.cur + 1)
+        super().add_entry(entry)
 
     def __init__(self, value: str = ""):
+        self._changes = []
         self.add_entry((value, 0, None))
 
 
@@ -9,9 +9,6 @@ from contextlib import redirect_stdout, suppress
 from typing import overload
 from weakref import WeakSet
 
-import aiohttp
-import jinja2
-
 with open(os.devnull, "w") as f, redirect_stdout(f):
     import pygame as pg
 
@@ -27,7 +24,7 @@ from .config import default_style_sheet, g
 from .EventManager import EventManager, _Event
 from .J import SingleJ
 from .modals.Alert import Alert
-from .types import Color, ColorValue, FrozenDCache, Surface
+from .types import Color, ColorValue, Surface
 from .utils.Console import Console
 from .utils.FileWatcher import FileWatcher
 from .utils.Navigator import LOADPAGE, URL, push
@@ -42,9 +39,6 @@ CLOCK = pg.time.Clock()
 default_sheet = Style.parse_sheet(default_style_sheet)
 """ The default ua-sheet """
 
-config.jinja_env = jinja2.Environment(
-    loader=jinja2.loaders.FileSystemLoader("."), enable_async=True
-)
 config.file_watcher = FileWatcher()
 config.event_manager = EventManager()
 
@@ -53,20 +47,19 @@ def _reset_config():
     # all of this is route specific
     # TODO: split cstyles into two styles. inherited and not inherited
     # # css_sheets = Cache[Style.SourceSheet]()
-    css_sheets = WeakSet[Style.SourceSheet]()
+    # the containers are reused and cleared in place
+    css_sheets: WeakSet[Style.SourceSheet] = g["css_sheets"]
+    css_sheets.clear()
     css_sheets.add(default_sheet)
-    g.update(
-        {
-            "target": None,  # the target of the url fragment
-            "icon_srcs": [],  # list[str] specified icon srcs
-            # css
-            "recompute": True,  # bool
-            "cstyles": FrozenDCache(),  # FrozenDCache[computed_style] # the style cache
-            "css_sheets": css_sheets,  # a list of used css SourceSheets
-            "css_dirty": True,  # bool
-            "css_sheet_len": 1,  # int
-        }
-    )
+    g["cstyles"].clear()
+    # the keys are written one by one instead of building a temporary dict
+    g["target"] = None  # the target of the url fragment
+    g["icon_srcs"] = []  # list[str] specified icon srcs
+    # css
+    g["recompute"] = True  # bool
+    g["css_dirty"] = True  # bool
+    g["css_sheet_len"] = 1  # int
+    g["css_sheet"] = None  # SourceSheet | None
 
 
 @overload
@@ -127,8 +120,12 @@ def set_config(**kwargs):
 def _set_title():
     head = g["root"].children[0]
     assert isinstance(head, Element.MetaElement)
-    titles = [title.text for title in head.children if title.tag == "title"]
-    pg.display.set_caption(titles[-1] if titles else g["title"])
+    # the last title wins
+    title = next(
+        (child.text for child in reversed(head.children) if child.tag == "title"),
+        g["title"],
+    )
+    pg.display.set_caption(title)
 
 
 async def _load_page(event):
@@ -162,26 +159,58 @@ async def main(route: str):
     if not hasattr(config, "screen"):
         set_config()
     positron.utils.clipboard.init()
+    # the frame loop only uses local names
+    # config.screen is not bound because set_config can replace it
+    get_events = pg.event.get
+    flip, tick = pg.display.flip, CLOCK.tick
+    event_manager = config.event_manager
+    tasks = config.tasks
+    QUIT = pg.QUIT
+    # the frames are paced on the event loop instead of blocking a thread in CLOCK.tick
+    loop = asyncio.get_running_loop()
+    next_frame = loop.time()
+    # events are kept until there is a root to handle them
+    events: list[pg.event.Event] = []
     while True:
-        if pg.event.peek(pg.QUIT):
-            return
-        if load_events := pg.event.get(LOADPAGE):
-            # XXX: We only need to consider the last load event
-            await _load_page(load_events[-1])
+        # the event queue is only walked once per frame
+        load_event = None
+        for event in get_events():
+            if event.type == QUIT:
+                return
+            elif event.type == LOADPAGE:
+                # XXX: We only need to consider the last load event
+                load_event = event
+            else:
+                events.append(event)
+        if load_event is not None:
+            await _load_page(load_event)
         root = g["root"]
-        await util.gather_tasks(config.tasks)
+        await util.gather_tasks(tasks)
         if root:
-            if g["css_dirty"] or g["css_sheet_len"] != len(g["css_sheets"]):
-                root.apply_style(Style.SourceSheet.join(g["css_sheets"]))
+            # the sheets are only joined again when they changed
+            # otherwise the joined sheet (and its media rules) is reused
+            css_sheets = g["css_sheets"]
+            sheet = g["css_sheet"]
+            sheet_len = len(css_sheets)
+            css_dirty = g["css_dirty"]
+            if sheet is None or g["css_sheet_len"] != sheet_len:
+                sheet = g["css_sheet"] = Style.SourceSheet.join(css_sheets)
+                g["css_sheet_len"] = sheet_len
+                css_dirty = True
+            if css_dirty:
+                root.apply_style(sheet)
                 g["css_dirty"] = False
-                g["css_sheet_len"] = len(g["css_sheets"])
 
             root.compute()
             root.layout()
 
-            config.screen.fill(g["bg_color"])
-            root.draw(config.screen)
-            config.event_manager.draw(config.screen)
+            screen = config.screen
+            screen.fill(g["bg_color"])
+            root.draw(screen)
+            event_manager.draw(screen)
+            # the input needs a root that has been laid out
+            await event_manager.handle_events(events)
+            events = []
         if config.DEBUG:
             util.draw_text(
                 config.screen,
@@ -190,12 +219,18 @@ async def main(route: str):
                 "black",
                 topleft=(20, 20),
             )
-        pg.display.flip()
-        await asyncio.to_thread(CLOCK.tick, g["FPS"])
-        if root:
-            await config.event_manager.handle_events(
-                pg.event.get(exclude=(pg.QUIT, LOADPAGE))
-            )
+        flip()
+        # without an argument tick only measures the frame for CLOCK.get_fps
+        tick()
+        if fps := g["FPS"]:
+            next_frame += 1 / fps
+            now = loop.time()
+            if next_frame < now:
+                # the frame took too long, so don't try to catch up
+                next_frame = now
+            await asyncio.sleep(next_frame - now)
+        else:
+            await asyncio.sleep(0)
 
 
 async def arun(route: str = "/"):
@@ -211,6 +246,8 @@ async def arun(route: str = "/"):
     config.event_loop = asyncio.get_running_loop()
     config.default_task = util.create_task(asyncio.sleep(0), True)
     config.tasks.append(Console(globals()))
+    import aiohttp
+
     config.aiosession = aiohttp.ClientSession()
     try:
         await main(route)
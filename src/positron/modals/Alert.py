@@ -15,9 +15,9 @@ from positron.types import Rect, Surface
 
 
 class Alert(Modal):
-    rect = Rect(0, 0, max(g["W"], 175), max(g["H"], 500))
-
     def __init__(self, title: str, msg: str, can_escape: bool):
+        # every Alert has its own rect, sized to the current window
+        self.rect = Rect(0, 0, max(g["W"], 175), max(g["H"], 500))
         self.title = title
         self.msg = msg
         self.can_escape = can_escape
@@ -32,7 +32,8 @@ class Alert(Modal):
         # TODO: layout button
         height += 500
         width = max(rect.width // 3, 175)
-        rect = Rect(0, 0, width, height)
+        self.rect = Rect(0, 0, width, height)
+        self.rect.center = rect.center
 
     def draw(self, surf: Surface):
         ...
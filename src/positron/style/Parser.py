@@ -2,23 +2,31 @@
 The parsing that is mostly independent of Style.py
 """
 
+import sys
 from contextlib import contextmanager
+from functools import lru_cache
 
 import tinycss
+from tinycss.token_data import Token
 
 
 class CustomCSSParser(tinycss.CSS21Parser):
-    def parse_declaration(self, tokens: list[tinycss.token_data.Token]):
+    def parse_declaration(self, tokens: list[Token]):
         # custom properties like
         # --my-custom-property: 10px
-        first_token, second_token, *rest = tokens
-        if first_token.value == "-" and second_token.type == "IDENT":
-            value = first_token.value + second_token.value
+        # only the first two tokens are peeked, most declarations are not custom
+        first_token = tokens[0]
+        if (
+            first_token.value == "-"
+            and len(tokens) > 1
+            and (second_token := tokens[1]).type == "IDENT"
+        ):
+            value = "-" + second_token.value
             tokens = [
-                tinycss.token_data.Token(
+                Token(
                     "IDENT", value, value, None, first_token.line, first_token.column
                 ),
-                *rest,
+                *tokens[2:],
             ]
         return super().parse_declaration(tokens)
 
@@ -44,7 +52,18 @@ def set_curr_file(file: str):
 
 
 IMPORTANT = " !important"
+_IMPORTANT_LEN = len(IMPORTANT)
 
 
+# the same declaration values come up again and again
+@lru_cache(maxsize=2048)
 def parse_important(s: str) -> tuple[str, bool]:
-    return (s[: -len(IMPORTANT)], True) if s.endswith(IMPORTANT) else (s, False)
+    return (s[:-_IMPORTANT_LEN], True) if s.endswith(IMPORTANT) else (s, False)
+
+
+def intern_value(s: str) -> str:
+    """
+    Interns short single token values (mostly keywords like "inherit" or "auto")
+    so that comparing them to the (interned) literals is just a pointer comparison
+    """
+    return sys.intern(s) if len(s) <= 16 and " " not in s else s
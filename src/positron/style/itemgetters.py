@@ -1,4 +1,5 @@
 from operator import itemgetter
+from sys import intern
 from typing import Any, Generic, Mapping, Protocol
 
 from positron.types import CO_T, V_T, AutoLP, Color, LengthPerc, Str4Tuple
@@ -16,12 +17,13 @@ class T4Getter(Protocol[CO_T]):
 
 
 class itemsetter(Generic[V_T]):
+    __slots__ = ("keys",)
+
     def __init__(self, keys: tuple[str, ...]):
         self.keys = keys
 
     def __call__(self, map: dict, values: tuple[V_T, ...]) -> None:
-        for key, value in zip(self.keys, values):
-            map[key] = value
+        map.update(zip(self.keys, values))
 
 
 directions = ("top", "right", "bottom", "left")
@@ -29,12 +31,13 @@ corners = ("top-left", "top-right", "bottom-right", "bottom-left")
 
 # fmt: off
 inset_keys = directions
-marg_keys: Str4Tuple = tuple(f"margin-{k}" for k in directions)     # type: ignore[assignment]
-pad_keys: Str4Tuple = tuple(f"padding-{k}" for k in directions)     # type: ignore[assignment]
-bs_keys: Str4Tuple = tuple(f"border-{k}-style" for k in directions) # type: ignore[assignment]
-bw_keys: Str4Tuple = tuple(f"border-{k}-width" for k in directions) # type: ignore[assignment]
-bc_keys: Str4Tuple = tuple(f"border-{k}-color" for k in directions) # type: ignore[assignment]
-br_keys: Str4Tuple = tuple(f"border-{k}-radius" for k in corners)   # type: ignore[assignment]
+# the keys are interned like the property names in the computed styles
+marg_keys: Str4Tuple = tuple(intern(f"margin-{k}") for k in directions)     # type: ignore[assignment]
+pad_keys: Str4Tuple = tuple(intern(f"padding-{k}") for k in directions)     # type: ignore[assignment]
+bs_keys: Str4Tuple = tuple(intern(f"border-{k}-style") for k in directions) # type: ignore[assignment]
+bw_keys: Str4Tuple = tuple(intern(f"border-{k}-width") for k in directions) # type: ignore[assignment]
+bc_keys: Str4Tuple = tuple(intern(f"border-{k}-color") for k in directions) # type: ignore[assignment]
+br_keys: Str4Tuple = tuple(intern(f"border-{k}-radius") for k in corners)   # type: ignore[assignment]
 
 ALPGetter = T4Getter[AutoLP]
 inset_getter: ALPGetter = itemgetter(*inset_keys)   # type: ignore[assignment]
@@ -98,9 +98,6 @@ class frozendict(_frozendict):
     def __ror__(self, other):
         return dict(self) | dict(other)
 
-    def items(self):
-        return [tuple(item) for item in super().items()]
-
 
 class Vector2(_Vector2):
     def __iter__(self):
@@ -108,11 +105,14 @@ class Vector2(_Vector2):
         yield self.y
 
     def __add__(self, other: Any) -> "Vector2":
-        other: Vector2 = Vector2(other)
+        # vectors don't need to be converted first
+        if not isinstance(other, _Vector2):
+            other = Vector2(other)
         return Vector2(self.x + other.x, self.y + other.y)
 
     def __sub__(self, other: Any) -> "Vector2":
-        other: Vector2 = Vector2(other)
+        if not isinstance(other, _Vector2):
+            other = Vector2(other)
         return Vector2(self.x - other.x, self.y - other.y)
 
     def __mul__(self, other: float) -> "Vector2":  # type: ignore [override]
@@ -123,20 +123,20 @@ class Rect(_Rect):
     @property
     def corners(self):
         """clock-wise"""
-        return (
-            self.topleft,
-            self.topright,
-            self.bottomright,
-            self.bottomleft,
-        )
+        # computed from one unpacking instead of four attribute lookups
+        x, y, w, h = self
+        return ((x, y), (x + w, y), (x + w, y + h), (x, y + h))
 
     @property
     def sides(self):
+        x, y, w, h = self
+        topleft, topright = (x, y), (x + w, y)
+        bottomleft, bottomright = (x, y + h), (x + w, y + h)
         return (
-            (self.topleft, self.topright),
-            (self.bottomleft, self.bottomright),
-            (self.topleft, self.bottomleft),
-            (self.topright, self.bottomright),
+            (topleft, topright),
+            (bottomleft, bottomright),
+            (topleft, bottomleft),
+            (topright, bottomright),
         )
 
     @staticmethod
@@ -156,33 +156,32 @@ CSSDimension_T = TypeVar(
 )  # could be Self -> definitely a reason to switch to 3.11
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CSSDimension:
     value: float
 
+    # the dimensions are only compatible with exactly the same class
     def __add__(self: CSSDimension_T, other: CSSDimension_T) -> CSSDimension_T:
-        if not isinstance(other, self.__class__):
+        cls = self.__class__
+        if other.__class__ is not cls:
             raise ValueError
-        return self.__class__(self.value + float(other))
+        return cls(self.value + other.value)
 
     def __sub__(self: CSSDimension_T, other: CSSDimension_T) -> CSSDimension_T:
-        if not isinstance(other, self.__class__):
+        cls = self.__class__
+        if other.__class__ is not cls:
             raise ValueError
-        return self.__class__(self.value - float(other))
+        return cls(self.value - other.value)
 
     def __mul__(self: CSSDimension_T, other: float) -> CSSDimension_T:
+        # zero times anything is zero, which is the most common case
+        if self.value == 0:
+            return self.__class__(0)
         if not isinstance(other, Number):
-            if self.value == 0:
-                return self.__class__(0)
             raise ValueError
         return self.__class__(self.value * other)
 
-    def __rmul__(self: CSSDimension_T, other: float) -> CSSDimension_T:
-        if not isinstance(other, Number):
-            if self.value == 0:
-                return self.__class__(0)
-            raise ValueError
-        return self.__class__(self.value * other)
+    __rmul__ = __mul__
 
     def __div__(self: CSSDimension_T, other: float) -> CSSDimension_T:
         if not isinstance(other, Number):
@@ -199,10 +198,8 @@ class CSSDimension:
         return f"{self.__class__.__name__}({self.value})"
 
 
-@dataclass(frozen=True, repr=False)
+@dataclass(frozen=True, slots=True, repr=False)
 class Percentage(CSSDimension):
-    value: float
-
     def resolve(self, num: float):
         """
         Resolves the Percentage with the given number
@@ -216,30 +213,28 @@ class Percentage(CSSDimension):
         return f"{self.value}%"
 
 
-@dataclass(frozen=True, repr=False)
+@dataclass(frozen=True, slots=True, repr=False)
 class Length(CSSDimension):
-    value: float
-
     def __str__(self):
         return f"{self.value}px"
 
 
-@dataclass(frozen=True, repr=False)
+@dataclass(frozen=True, slots=True, repr=False)
 class Angle(CSSDimension):
-    value: float
+    pass
 
 
-@dataclass(frozen=True, repr=False)
+@dataclass(frozen=True, slots=True, repr=False)
 class Time(CSSDimension):
-    value: float
+    pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Resolution(CSSDimension):
-    value: float
+    pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FontStyle:
     value: Literal["normal", "italic", "oblique"]
     angle: float
@@ -304,9 +299,15 @@ class Cache(
         if (new_type := redirect.get(type(val))) is not None:
             val = new_type(val)
         key = hash(val)
-        if key not in self.cache:
-            self.cache[key] = val
-        return self.cache[key]
+        # a single lookup instead of checking and then fetching
+        cached = self.cache.get(key)
+        # on a hash collision the new value replaces the cached one
+        if cached is None or (cached is not val and cached != val):
+            self.cache[key] = cached = val
+        return cached
+
+    def clear(self):
+        self.cache.clear()
 
     def __bool__(self):
         return bool(self.cache)
@@ -318,7 +319,9 @@ class Cache(
         return repr(set(self.cache.values()))
 
     def __contains__(self, value: K_T) -> bool:
-        return hash(value) in self.cache
+        # a colliding hash alone doesn't mean that the value is cached
+        cached = self.cache.get(hash(value))
+        return cached is not None and (cached is value or cached == value)
 
     def __iter__(self):
         return self.cache.values()
@@ -36,16 +36,16 @@ async def _Console(context):
     """
     The Console takes input asynchronously and executes it. For debugging purposes only
     """
+    globals_ = globals()
     while True:
         try:
             __x_______ = await aioconsole.ainput(">>> ")
-            args = [__x_______, globals(), context]
             try:
-                r = eval(*args)
+                r = eval(__x_______, globals_, context)
                 if r is not None:
                     print(r)
             except SyntaxError:
-                exec(*args)
+                exec(__x_______, globals_, context)
         except asyncio.exceptions.CancelledError:
             break
         except Exception as e:
@@ -18,31 +18,37 @@ class FileWatcher(FileSystemEventHandler):
     """
 
     def __init__(self):
-        self.last_hit = time.monotonic()  # this doesn't need to be extremely accurate
-        self.files = set[str]()
+        # time.monotonic() of the last reload per file, this doesn't need to be extremely accurate
+        self.last_hit: dict[str, float] = {}
         self.dirs = set[str]()
         self.callbacks: dict[str, Callable] = {}
+        # one Observer thread watches all directories
+        # it is only started when the first file is added
+        self.observer: Observer | None = None
 
     def add_file(self, file: str, callback: Callable):
         file = os.path.abspath(file)
-        self.files.add(file)
         self.callbacks[file] = callback
         new_dir = os.path.dirname(file)
         if new_dir not in self.dirs:
             self.dirs.add(new_dir)
-            ob = Observer()
-            ob.schedule(self, new_dir)
-            ob.start()
+            if self.observer is None:
+                self.observer = Observer()
+                self.observer.start()
+            self.observer.schedule(self, new_dir)
 
     def on_modified(self, event: FileSystemEvent):
         path: str = event.src_path
         logging.debug(f"File modified: {path}")
-        if path in self.files and (t := time.monotonic()) - self.last_hit > 1:
+        if (callback := self.callbacks.get(path)) is None:
+            return
+        # every file is debounced on its own
+        if (t := time.monotonic()) - self.last_hit.get(path, 0) > 1:
             create_task(
-                acall(self.callbacks[path]),
+                acall(callback),
                 sync=True,
             )
-            self.last_hit = t
+            self.last_hit[path] = t
 
 
 ####################################################################
@@ -37,7 +37,7 @@ class History(list[V_T]):
         """
         Whether there is history to go back to
         """
-        return bool(self.cur)
+        return self.cur > 0
 
     def forward(self):
         """
@@ -50,18 +50,20 @@ class History(list[V_T]):
         """
         Whether we can go back into the future
         """
-        return bool(self.cur - len(self) + 1)
+        return self.cur < len(self) - 1
 
     def add_entry(self, entry: V_T):
         """
         Add an entry to the history
         """
         self.cur += 1
-        self[:] = [*self[: self.cur], entry]
+        # drop the entries after the current one in place
+        del self[self.cur :]
+        self.append(entry)
 
     def clear(self):
         """
         Clear history
         """
         super().clear()
-        del self.cur
+        self.cur = -1
@@ -4,6 +4,7 @@ import os
 import webbrowser
 from dataclasses import dataclass, field
 from enum import auto
+from functools import cached_property, lru_cache
 from typing import Any, Callable
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
@@ -31,20 +32,27 @@ class URL:
     netloc: str = ""
     params: str = ""
 
-    def __str__(self):
+    @cached_property
+    def _str(self) -> str:
+        # hashing and comparing both need the string, so it is only built once
         query = urlencode(self.kwargs)
         return urlunparse(
             (self.scheme, self.netloc, self.route, self.params, query, self.target)
         )
 
+    def __str__(self):
+        return self._str
+
     def __hash__(self) -> int:
         # we want to hash like our counterpart strings
-        return hash(str(self))
+        return hash(self._str)
 
     def __eq__(self, other):
-        if not isinstance(other, (URL, str)):
-            raise NotImplemented
-        return str(self) == str(other)
+        if isinstance(other, URL):
+            return self._str == other._str
+        if isinstance(other, str):
+            return self._str == other
+        return NotImplemented
 
     @property
     def is_internal(self):
@@ -57,6 +65,12 @@ AnyURL = URL | str
 def make_url(url: AnyURL) -> URL:
     if isinstance(url, URL):
         return url
+    return _make_url_from_str(url)
+
+
+@lru_cache(maxsize=1024)
+def _make_url_from_str(url: str) -> URL:
+    # the same urls are navigated to again and again
     parsed = urlparse(url)
     return URL(
         parsed.path,
@@ -81,7 +95,7 @@ class UrlLookupResult(Enum):
 
 routes: dict[str, Callable] = {}
 history = History[URL]()
-visited_links: dict[AnyURL, UrlLookupResult] = {}
+visited_links: dict[str, UrlLookupResult] = {}
 
 
 def add_route(route: str):
@@ -111,7 +125,9 @@ def goto(url: AnyURL) -> UrlLookupResult:
     goto("index.html") -> UrlLookupResult.Internal
     will open the file index.html in the cwd if possible
     """
-    status = visited_links.get(url, UrlLookupResult.Internal)
+    # the links are stored by their string form
+    key = url if isinstance(url, str) else str(url)
+    status = visited_links.get(key, UrlLookupResult.Internal)
     if status == UrlLookupResult.Invalid:
         return status  # we already reported that the url is invalid
     elif status == UrlLookupResult.Internal:
@@ -131,7 +147,7 @@ def goto(url: AnyURL) -> UrlLookupResult:
         if not webbrowser.open_new_tab(str(url)):
             status = UrlLookupResult.Invalid
             util.log_error(f"Invalid route: {url!r}")
-    visited_links[url] = status
+    visited_links[key] = status
     return status
 
 
@@ -174,21 +190,41 @@ def reload():
     goto(history.current)
 
 
-def load_dom_frm_str(html: str, *args, **kwargs):
+def _render(html: str, *args, **kwargs) -> str:
     """
-    Loads the dom from the given html or jinja markup
+    Renders the jinja markup synchronously
     """
     env = config.jinja_env
+    if not env.is_async:
+        return env.from_string(html).render(*args, **kwargs)
     with util.set_context(env, "is_async", False):
-        html = env.from_string(html).render(*args, **kwargs)
-    g["root"] = Element.HTMLElement.from_string(html)
+        return env.from_string(html).render(*args, **kwargs)
+
+
+async def _arender(html: str, *args, **kwargs) -> str:
+    """
+    Renders the jinja markup with render_async if the environment is async (config.jinja_async),
+    otherwise with the sync renderer that skips all the awaitable checks
+    """
+    env = config.jinja_env
+    if env.is_async:
+        return await env.from_string(html).render_async(*args, **kwargs)
+    # globals and filters can touch the app state, so this stays on the main thread
+    return env.from_string(html).render(*args, **kwargs)
+
+
+def load_dom_frm_str(html: str, *args, **kwargs):
+    """
+    Loads the dom from the given html or jinja markup
+    """
+    g["root"] = Element.HTMLElement.from_string(_render(html, *args, **kwargs))
 
 
 async def aload_dom_frm_str(html: str, *args, **kwargs):
     """
     Loads the dom from the given html or jinja markup asynchronously
     """
-    html = await config.jinja_env.from_string(html).render_async(*args, **kwargs)
+    html = await _arender(html, *args, **kwargs)
     g["root"] = Element.HTMLElement.from_string(html)
 
 
@@ -196,9 +232,7 @@ def load_dom(file: str, *args, **kwargs):
     """
     Loads the dom from a file
     """
-    env = config.jinja_env
-    with util.set_context(env, "is_async", False):
-        html = env.from_string(util.File(file).read()).render(*args, **kwargs)
+    html = _render(util.File(file).read(), *args, **kwargs)
     g["root"] = Element.HTMLElement.from_string(html)
     config.file_watcher.add_file(file, reload)
 
@@ -213,7 +247,7 @@ async def aload_dom(url: AnyURL):
     if response.type == util.ResponseType.File:
         config.file_watcher.add_file(url.route, reload)
         kwargs = url.kwargs
-    html = await config.jinja_env.from_string(response.text).render_async(**kwargs)
+    html = await _arender(response.text, **kwargs)
     g["root"] = Element.HTMLElement.from_string(html)
 
 
@@ -11,6 +11,7 @@ fetching data from the web or the file system,
 """
 
 import asyncio
+import atexit
 import binascii
 import errno
 import inspect
@@ -20,13 +21,16 @@ import os
 import re
 import socket
 import sys
+import time
 import uuid
-from contextlib import asynccontextmanager, redirect_stdout, contextmanager, suppress
-from dataclasses import dataclass
+from contextlib import asynccontextmanager, redirect_stdout, contextmanager
+from dataclasses import dataclass, field
 from enum import auto
-from functools import cache, wraps
-from typing import Callable, Literal
+from functools import cache, lru_cache, wraps
+from operator import attrgetter
+from typing import Callable, Literal, TextIO
 from urllib.parse import unquote_plus, urlparse
+from weakref import WeakKeyDictionary
 
 import positron.config as config
 from positron.types import Enum, OpenMode, OpenModeReading, OpenModeWriting
@@ -49,26 +53,62 @@ a_isfile = _wrap(os.path.isfile)
 aos_remove = _wrap(os.remove)
 
 
+def _callback_meta(callback) -> tuple[int | None, bool, bool]:
+    """
+    The number of parameters that can take positional arguments
+    (None if the signature is unknown), whether the first of them takes a single argument
+    and whether the callback is a coroutine function
+    """
+    try:
+        params = [
+            param
+            for param in inspect.signature(callback).parameters.values()
+            if param.kind is not inspect.Parameter.KEYWORD_ONLY
+        ]
+    except ValueError:
+        return None, False, inspect.iscoroutinefunction(callback)
+    first_single = bool(params) and params[0].kind in (
+        inspect.Parameter.POSITIONAL_ONLY,
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    )
+    return len(params), first_single, inspect.iscoroutinefunction(callback)
+
+
+# keyed weakly on the underlying functions, so that callbacks don't keep their elements alive
+_callback_metas: WeakKeyDictionary[
+    Callable, tuple[int | None, bool, bool]
+] = WeakKeyDictionary()
+
+
+def _get_callback_meta(callback) -> tuple[int | None, bool]:
+    """
+    The number of positional arguments the callback takes (None if unknown)
+    and whether it is a coroutine function
+    """
+    func = getattr(callback, "__func__", callback)
+    try:
+        meta = _callback_metas.get(func)
+        if meta is None:
+            meta = _callback_metas[func] = _callback_meta(func)
+    except TypeError:  # callables that can't be weakly referenced aren't cached
+        func = callback
+        meta = _callback_meta(callback)
+    n, first_single, is_coro = meta
+    # the function of a bound method also takes self (or cls)
+    if func is not callback and n is not None and first_single:
+        n -= 1
+    return n, is_coro
+
+
 async def acall(callback, *args, **kwargs):
     """
     Intelligently calls the callback with the given arguments, matching the most args
     """
-    sig = inspect.signature(callback)
-    _args = args[
-        : min(
-            len(
-                [
-                    param
-                    for param in sig.parameters.values()
-                    if param.kind is not inspect.Parameter.KEYWORD_ONLY
-                ]
-            ),
-            len(args),
-        )
-    ]
+    n, is_coro = _get_callback_meta(callback)
+    _args = args if n is None else args[:n]
     return await (
         callback(*_args, **kwargs)
-        if inspect.iscoroutinefunction(callback)
+        if is_coro
         else asyncio.to_thread(callback, *_args, **kwargs)
     )
 
@@ -77,21 +117,8 @@ def call(callback, *args, **kwargs):
     """
     Synchronous version of acall
     """
-    _args = args
-    with suppress(ValueError):
-        sig = inspect.signature(callback)
-        _args = args[
-            : min(
-                len(
-                    [
-                        param
-                        for param in sig.parameters.values()
-                        if param.kind is not inspect.Parameter.KEYWORD_ONLY
-                    ]
-                ),
-                len(args),
-            )
-        ]
+    n, _ = _get_callback_meta(callback)
+    _args = args if n is None else args[:n]
     rv = callback(*_args, **kwargs)
     if inspect.isawaitable(rv):
         return create_task(rv)
@@ -146,13 +173,20 @@ def task_in_thread(func, *args, **kwargs):
     return create_task(asyncio.to_thread(func, *args, **kwargs))
 
 
+_is_sync = attrgetter("sync")
+
+
 async def gather_tasks(tasks: list[Task]):
-    syncs, nosyncs = group_by_bool(tasks, lambda task: task.sync)
+    syncs, nosyncs = group_by_bool(tasks, _is_sync)
     tasks[:] = nosyncs
     if syncs:
         return await asyncio.wait(syncs)
 
 
+_BINARY_BUFFERING = 1 << 20
+_DOWNLOAD_BATCH = 2 << 20
+
+
 @dataclass(frozen=True, slots=True)
 class File:
     """
@@ -174,6 +208,10 @@ class File:
     def open(self, mode: OpenMode, *args, **kwargs):
         if self.encoding:
             kwargs.setdefault("encoding", self.encoding)
+        if "b" in mode:
+            kwargs.pop("encoding", None)
+            # large buffers mean fewer syscalls for big binary files
+            kwargs.setdefault("buffering", _BINARY_BUFFERING)
         with open(self.name, mode, *args, **kwargs) as f:
             yield f
 
@@ -190,31 +228,56 @@ class File:
         with self.open(mode, *args, **kwargs) as f:
             return f.read()
 
-    aread = _wrap(read)
+    async def aread(self, mode: OpenModeReading = "r", *args, **kwargs):
+        return await asyncio.to_thread(self.read, mode, *args, **kwargs)
 
-    def write(self, mode: OpenModeWriting = "w", *args, **kwargs):
+    def write(self, data: str | bytes, mode: OpenModeWriting = "w", *args, **kwargs):
         with self.open(mode, *args, **kwargs) as f:
-            return f.write()
+            return f.write(data)
+
+    async def awrite(
+        self, data: str | bytes, mode: OpenModeWriting = "w", *args, **kwargs
+    ):
+        return await asyncio.to_thread(self.write, data, mode, *args, **kwargs)
+
 
-    awrite = _wrap(write)
+_ONLINE_TTL = 5.0  # seconds
+# (time.monotonic() of the last check, result)
+_online_cache: tuple[float, bool] = (-_ONLINE_TTL, False)
 
 
 def is_online() -> bool:
+    """
+    Whether the computer is connected to a network.
+    This is checked every frame, so the result is reused for a few seconds
+    """
+    global _online_cache
+    now = time.monotonic()
+    last_check, online = _online_cache
+    if now - last_check < _ONLINE_TTL:
+        return online
     # https://www.codespeedy.com/how-to-check-the-internet-connection-in-python/
-    own_adress = socket.gethostbyname(socket.gethostname())
-    return own_adress != "127.0.0.1"
+    try:
+        online = socket.gethostbyname(socket.gethostname()) != "127.0.0.1"
+    except OSError:
+        online = False
+    _online_cache = (now, online)
+    return online
 
 
 created_files: set[str] = set()
 
 
-def _make_new_filename(name):
-    def lamda(groups: list[str]):
-        return f"({int(groups[0]) + 1})"
+# matches the last "(n)" in a name, the regex is flipped because it is run in reverse: (3) -> )3(
+_copy_number_re = re.compile(r"\)(\d+)\(")
 
-    if (
-        new_name := rev_sub(r"\)(\d+)\(", name, lamda, 1)  # regex is flipped (3)->)3(
-    ) != name:
+
+def _increment_copy_number(groups: list[str]) -> str:
+    return f"({int(groups[0]) + 1})"
+
+
+def _make_new_filename(name):
+    if (new_name := rev_sub(_copy_number_re, name, _increment_copy_number, 1)) != name:
         return new_name
     else:
         name, ext = os.path.splitext(name)
@@ -226,22 +289,32 @@ def create_file(file_name: str) -> str:
     Definitely create a new file
     """
     file_name = os.path.abspath(file_name)
-    try:
-        with open(file_name, "x") as _:
-            created_files.add(file_name)
-            return file_name
-    except FileExistsError:
-        return create_file(_make_new_filename(file_name))
+    while True:
+        try:
+            # O_EXCL makes the existence check and the creation atomic
+            fd = os.open(file_name, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            file_name = _make_new_filename(file_name)
+            continue
+        os.close(fd)
+        created_files.add(file_name)
+        return file_name
+
+
+def _remove_all(files: list[str]):
+    for file in files:
+        try:
+            os.remove(file)
+        except OSError:
+            pass
 
 
 async def delete_created_files():
-    global created_files
     if created_files:
         logging.info(f"Deleting: {created_files}")
-        await asyncio.gather(
-            *(aos_remove(file) for file in created_files),
-            return_exceptions=True,
-        )
+        # one thread removes all files instead of one thread per file
+        await asyncio.to_thread(_remove_all, list(created_files))
+        created_files.clear()
 
 
 save_dir = os.environ.get("TEMP") or "."
@@ -254,7 +327,7 @@ class ResponseType(Enum):
 
 
 # TODO: split up Response in RawResponse and StringResponse
-@dataclass
+@dataclass(slots=True)
 class Response:
     url: str
     content: str | bytes
@@ -263,6 +336,9 @@ class Response:
     _charset: str = ""  # aka encoding
     _mime_type: str = ""
     _ext: str = ""
+    # the converted content, filled on first access
+    _text: str | None = field(default=None, init=False, repr=False)
+    _raw: bytes | None = field(default=None, init=False, repr=False)
 
     @property
     def israw(self):
@@ -272,54 +348,76 @@ class Response:
     def charset(self):
         return self._charset or sys.getdefaultencoding()
 
+    # content is never replaced, so the conversions are only done once
     @property
-    def text(self):
-        if isinstance(self.content, str):
-            return self.content
-        else:
-            return self.content.decode(self.charset)
+    def text(self) -> str:
+        if self._text is None:
+            content = self.content
+            self._text = (
+                content if isinstance(content, str) else content.decode(self.charset)
+            )
+        return self._text
 
     @property
-    def raw(self):
-        if isinstance(self.content, bytes):
-            return self.content
-        else:
-            return self.content.encode(self.charset)
+    def raw(self) -> bytes:
+        if self._raw is None:
+            content = self.content
+            self._raw = (
+                content if isinstance(content, bytes) else content.encode(self.charset)
+            )
+        return self._raw
 
     @property
     def mime_type(self):
         if not self._mime_type:
-            self._mime_type = mimetypes.guess_type(self.url, strict=False)
+            self._mime_type = _guess_mime_type(self.url)
         return self._mime_type
 
     @property
     def ext(self):
         if not self._ext:
             if self.mime_type:
-                self._ext = mimetypes.guess_extension(self.mime_type, strict=False)
+                self._ext = _guess_extension(self.mime_type)
             else:
                 _, self._ext = os.path.splitext(self.url)
         return self._ext
 
 
+# many responses share their urls and mime types
+@lru_cache(maxsize=256)
+def _guess_mime_type(url: str) -> str:
+    # guess_type returns (type, encoding)
+    return mimetypes.guess_type(url, strict=False)[0] or ""
+
+
+@lru_cache(maxsize=256)
+def _guess_extension(mime_type: str) -> str:
+    return mimetypes.guess_extension(mime_type, strict=False) or ""
+
+
+# data urls are ascii only (RFC 2397), so ascii whitespace is enough
+_whitespace_table = str.maketrans("", "", " \t\n\r\f\v")
+
 media_type_pattern = re.compile(r"[\w\-]+\/[\w\-]+(?:\;\w+\=\w+)*")
 
 
+# the mime type and the charset parameter (if any) of a media type in a single match
+_media_type_re = re.compile(
+    r'\s*([^;\s]*)(?:.*?;\s*charset\s*=\s*"?([^;\s"]+))?', re.IGNORECASE | re.DOTALL
+)
+
+
 def parse_media_type(
     media_type: str, mime_type: str = "", charset: str = ""
 ) -> tuple[str, str]:
+    """
+    Parses a media type like "text/html; charset=utf-8".
+    The given mime_type and charset are the defaults.
+    """
     if not media_type:
         return (mime_type, charset)
-    arr = media_type.split(";")
-    _charset = ""
-    _mime_type, *params = arr
-    try:
-        for param in params:
-            name, value = param.split("=")
-            if name == "charset":
-                charset = value
-    except ValueError:
-        return (mime_type, charset)
+    match = _media_type_re.match(media_type)
+    _mime_type, _charset = match.groups()  # type: ignore[union-attr]
     return _mime_type or mime_type, _charset or charset
 
 
@@ -352,7 +450,7 @@ async def fetch(url: str, raw: bool = False) -> Response:
         parameter  := attribute "=" value
         """
         url = url[5:]
-        url = re.sub(r"\s*", "", url)  # remove all whitespace
+        url = url.translate(_whitespace_table)  # remove all whitespace
         parser = GeneralParser(url)
         media_type = parser.consume(media_type_pattern)
         mime_type, charset = parse_media_type(media_type, "text/plain", "US-ASCII")
@@ -394,8 +492,15 @@ async def download(url: str) -> str:
         async with config.aiosession.get(url) as resp:
             new_file = create_file(os.path.basename(urlparse(url).path))
             async with File(new_file).aopen("wb") as f:
-                async for chunk in resp.content.iter_any():
-                    f.write(chunk)
+                # chunks are collected and written to the file in big batches
+                buffer = bytearray()
+                async for chunk in resp.content.iter_chunked(_BINARY_BUFFERING):
+                    buffer += chunk
+                    if len(buffer) >= _DOWNLOAD_BATCH:
+                        await asyncio.to_thread(f.write, buffer)
+                        buffer.clear()
+                if buffer:
+                    await asyncio.to_thread(f.write, buffer)
         return new_file
     elif url.startswith("data"):
         logging.warning(
@@ -404,8 +509,9 @@ async def download(url: str) -> str:
         )
         response = await fetch(url)
         new_file = create_file(uuid.uuid4().hex)
+        content = response.content
         await File(new_file).awrite(
-            "wb" if isinstance(response.content, bytes) else "w"
+            content, "wb" if isinstance(content, bytes) else "w"
         )
         return new_file
     else:
@@ -422,16 +528,43 @@ async def fetch_txt(src: str) -> str:
 _error_logfile = File("error.log", encoding="utf-8")
 
 
+_error_file: TextIO | None = None
+
+
+@atexit.register
+def _close_error_file():
+    if _error_file is not None:
+        _error_file.close()
+
+
+def _get_error_file() -> TextIO:
+    """
+    The shared handle of the error logfile.
+    It is reopened when the working directory changed (for example through set_cwd)
+    """
+    global _error_file
+    path = os.path.abspath(_error_logfile.name)
+    if _error_file is None or _error_file.name != path:
+        _close_error_file()
+        _error_file = open(path, "a", encoding=_error_logfile.encoding, buffering=1)
+    return _error_file
+
+
 @contextmanager
 def clog_error():
     """
     yields a context to print to the error logfile
     """
-    with _error_logfile.open("a") as file:
-        with redirect_stdout(file):
-            yield
+    with redirect_stdout(_get_error_file()):
+        yield
+
+
+def log_error(*args, **kwargs):
+    """
+    Prints to the error logfile
+    """
+    print(*args, file=_get_error_file(), **kwargs)
 
 
-log_error = clog_error()(print)
 print_once = cache(print)
 log_error_once = cache(log_error)
@@ -14,7 +14,8 @@ def get_clip() -> str:
     if not x:
         return ""
     # byte strings are regularly c-strings and therefore null delimited
-    return x.replace(b"\x00", b"").decode()
+    # malformed clipboard data shouldn't raise
+    return x.translate(None, b"\x00").decode("utf-8", errors="replace")
 
 
 def put_clip(clip: str):
@@ -23,4 +24,4 @@ def put_clip(clip: str):
     """
     # https://www.pygame.org/docs/ref/scrap.html#pygame.scrap.put
     # XXX: data needs to be bytes
-    scrap.put(pg.SCRAP_TEXT, clip.encode(encoding="ascii"))
+    scrap.put(pg.SCRAP_TEXT, clip.encode("utf-8"))
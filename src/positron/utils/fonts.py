@@ -3,19 +3,18 @@ Utils around fonts
 """
 
 from dataclasses import dataclass, field
-from functools import cached_property
-from itertools import takewhile
-from typing import Literal
+from functools import cached_property, lru_cache
+from typing import Literal, Sequence
 
 import pygame as pg
 from pygame.font import match_font, SysFont as _SysFont
 
 from positron.config import generic_font_families
 from positron.types import Color, ColorValue, Coordinate, Surface, Font as _Font
-from positron.utils import log_error, log_error_once, draw_text, sum_tuples
+from positron.utils import log_error, log_error_once, draw_text
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FontStyle:
     value: Literal["normal", "italic", "oblique"]
     angle: float
@@ -73,7 +72,7 @@ def valid_font(fonts: list[_Font], char: str) -> tuple[_Font, Metrics]:
 """
 
 
-def valid_font(fonts: list[_Font], char: str) -> _Font:
+def valid_font(fonts: Sequence[_Font], char: str) -> _Font:
     """
     Returns the first font from the list of fonts that can render the char.
     """
@@ -87,6 +86,54 @@ def valid_font(fonts: list[_Font], char: str) -> _Font:
     raise RuntimeError(f"No font could be found for {char}")
 
 
+# the font for every char that was already looked up, per tuple of fonts
+_char_fonts: dict[tuple[_Font, ...], dict[str, _Font]] = {}
+
+
+def fonts_for_chars(fonts: tuple[_Font, ...], text: str):
+    """
+    Splits the text into substrings that can each be rendered with one of the fonts
+    """
+    if not text:
+        return
+    # every unique char only probes the fonts once
+    char_fonts = _char_fonts.setdefault(fonts, {})
+    start = 0
+    current = None
+    for i, c in enumerate(text):
+        if (font := char_fonts.get(c)) is None:
+            font = char_fonts[c] = valid_font(fonts, c)
+        if font is not current:
+            if current is not None:
+                yield text[start:i], current
+            start, current = i, font
+    yield text[start:], current
+
+
+@lru_cache(maxsize=4096)
+def run_size(font: _Font, text: str) -> tuple[int, int]:
+    """
+    The size of a substring that is rendered with a single font
+    """
+    return font.size(text)
+
+
+@lru_cache(maxsize=4096)
+def text_size(fonts: tuple[_Font, ...], text: str) -> tuple[int, int]:
+    """
+    The size of the text rendered with the fonts.
+    The fonts are shared through the font_cache and mostly the same words
+    are measured again on every layout, so the results are cached.
+    """
+    # the sizes are accumulated directly instead of zipping tuples
+    w = h = 0
+    for substr, font in fonts_for_chars(fonts, text):
+        rw, rh = run_size(font, substr)
+        w += rw
+        h += rh
+    return (w, h)
+
+
 # class Font:
 #     whitespace: Metrics
 
@@ -130,35 +177,51 @@ class Font:
             )
         )
         self.color = Color(self.color)
+        self._fonts = tuple(self.fonts)
 
     def _fonts_for_chars(self, text: str):
-        i = 0
-        while i < len(text):
-            c = text[i]
-            font = valid_font(self.fonts, c)
-            string = c + "".join(
-                takewhile(lambda c: valid_font(self.fonts, c) == font, text[i + 1 :])
-            )
-            i += len(string)
-            yield string, font
+        return fonts_for_chars(self._fonts, text)
 
     @cached_property
     def linesize(self):
         return self.fonts[0].get_linesize()
 
     def size(self, text: str):
-        return sum_tuples(
-            font.size(substr) for substr, font in self._fonts_for_chars(text)
-        ) or (0, 0)
-
-    def draw(self, surf: Surface, pos: Coordinate, text: str):
+        return text_size(self._fonts, text)
+
+    def _layout(
+        self, text: str
+    ) -> tuple[list[tuple[str, _Font, int]], tuple[int, int]]:
+        """
+        The runs of the text with their fonts and widths, and the total size
+        """
+        runs: list[tuple[str, _Font, int]] = []
+        w = h = 0
+        for sub, font in fonts_for_chars(self._fonts, text):
+            rw, rh = run_size(font, sub)
+            runs.append((sub, font, rw))
+            w += rw
+            h += rh
+        return runs, (w, h)
+
+    def draw(
+        self,
+        surf: Surface,
+        pos: Coordinate,
+        text: str,
+        layout: list[tuple[str, _Font, int]] | None = None,
+    ):
         x, y = pos
-        for sub, font in self._fonts_for_chars(text):
+        if layout is None:
+            layout = self._layout(text)[0]
+        for sub, font, width in layout:
             draw_text(surf, sub, font, self.color, topleft=(x, y))
-            x += font.size(sub)[0]
+            x += width
 
     def render(self, text: str) -> Surface:
-        surf = Surface(self.size(text), flags=pg.SRCALPHA)
+        # the runs are only measured once for both the surface and the drawing
+        layout, size = self._layout(text)
+        surf = Surface(size, flags=pg.SRCALPHA)
         surf.fill("transparent")
-        self.draw(surf, (0, 0), text)
+        self.draw(surf, (0, 0), text, layout)
         return surf
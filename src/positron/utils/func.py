@@ -103,13 +103,12 @@ def group_by_bool(
     """
     Group a list into two lists depending on the bool value given by the key
     """
-    true = []
-    false = []
+    true: list[V_T] = []
+    false: list[V_T] = []
+    # bound appends save an attribute lookup per item
+    add_true, add_false = true.append, false.append
     for x in l:
-        if key(x):
-            true.append(x)
-        else:
-            false.append(x)
+        (add_true if key(x) else add_false)(x)
     return true, false
 
 
@@ -13,6 +13,7 @@ import positron.J as J
 import positron.Style as Style
 import positron.utils as util
 import positron.utils.Navigator as Navigator
+from positron.element.ElementAttribute import BooleanAttribute
 from positron.Selector import (
     AndSelector,
     ClassSelector,
@@ -25,7 +26,7 @@ from positron.Selector import (
     rel_p,
     sngl_p,
 )
-from positron.types import Auto, Color, FrozenDCache, Length, Percentage, Rect
+from positron.types import Auto, Cache, Color, FrozenDCache, Length, Percentage, Rect
 
 # fmt: on
 
@@ -132,6 +133,18 @@ def test_cache():
     del style4
     assert len(test_cache) == 0
 
+    # 5. on a hash collision the cache doesn't hand out an unequal value
+    class Colliding(str):
+        def __hash__(self):
+            return 0
+
+    cache = Cache[Colliding]()
+    a, b = Colliding("a"), Colliding("b")
+    assert cache.add(a) is a
+    assert b not in cache
+    assert cache.add(b) is b
+    assert b in cache
+
 
 def test_style_computing():
     # Helpers
@@ -275,6 +288,22 @@ def test_boxes():
     assert box.width == 100 - 2 * (20 + 3 + 10)
 
 
+def test_boolean_attribute():
+    class Elem:
+        disabled = BooleanAttribute("disabled")
+
+        def __init__(self):
+            self.attrs = {}
+
+    elem = Elem()
+    assert not elem.disabled
+    elem.disabled = True
+    assert elem.disabled and elem.attrs == {"disabled": ""}
+    elem.disabled = False
+    assert not elem.disabled and elem.attrs == {}
+    elem.disabled = False
+
+
 def test_J():
     with raises(AttributeError):  # should raise because g["root"] is None
         J.SingleJ("somevalidselector")
@@ -22,6 +22,16 @@ def test_delete():
     )
     assert delete_word_backword.after == ""
 
+    # "rea|dy, set, go"
+    delete_word_backword = Delete(
+        3, Delete.What.Word, Delete.Direction.Back, before="ready, set, go"
+    )
+    assert delete_word_backword.after == "dy, set, go"
+    delete_word_forward = Delete(
+        3, Delete.What.Word, Delete.Direction.For, before="ready, set, go"
+    )
+    assert delete_word_forward.after == "rea, set, go"
+
 
 def test_editing_ctx():
     x = EditingContext("")
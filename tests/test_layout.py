@@ -56,3 +56,35 @@ def test_p():
 
 
 test_p()
+
+
+async def test_input_in_load_frame():
+    """
+    Input that arrives in the same frame as a page load is only handled
+    once the new root has been laid out.
+    """
+    import asyncio
+
+    import pygame as pg
+
+    import positron.config as config
+    from positron.utils.Navigator import add_route, load_dom_frm_str
+
+    @add_route("/input-in-load-frame")
+    def _():
+        load_dom_frm_str("<html><head></head><body><p>Hello</p></body></html>")
+
+    config.event_loop = asyncio.get_running_loop()
+    pg.event.clear()
+    pg.event.post(
+        pg.event.Event(pg.MOUSEMOTION, pos=(5, 5), rel=(0, 0), buttons=(0, 0, 0))
+    )
+
+    async def quit_later():
+        await asyncio.sleep(0.2)
+        pg.event.post(pg.event.Event(pg.QUIT))
+
+    quitter = asyncio.create_task(quit_later())
+    # main pushes the route, so the LOADPAGE and the MOUSEMOTION share the first frame
+    await asyncio.wait_for(positron.main.main("/input-in-load-frame"), 5)
+    await quitter
@@ -108,3 +108,15 @@ async def test_async():
     assert await util.acall(afunc, 1, 2) == 1
     assert await util.acall(kwfunc, 1, d=3) == (1, 2, 3)
     assert await util.acall(kwargsfunc, 1, 2, d=3, e=4) == (1, 2, 3, {"e": 4})
+
+
+async def test_file(tmp_path):
+    text_file = util.File(str(tmp_path / "test.txt"))
+    assert text_file.write("héllo") == 5
+    assert text_file.read() == "héllo"
+    await text_file.awrite("wörld", "a")
+    assert await text_file.aread() == "héllowörld"
+
+    binary_file = util.File(str(tmp_path / "test.bin"))
+    await binary_file.awrite(b"\x00\x01", "wb")
+    assert binary_file.read("rb") == b"\x00\x01"